@@ -30,40 +30,73 @@ Folders:
 
 import os
 import sys
+import atexit
+import concurrent.futures
+import csv
 import time
 import json
-import ssl
-import smtplib
-import subprocess
+import logging
+import logging.handlers
+import mmap
 import re
+import shutil
 import string
 import threading
 import queue
-import textwrap
-import xml.etree.ElementTree as ET
-from datetime import datetime, date
-from email.message import EmailMessage
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+from enum import IntEnum
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, List, Tuple, TYPE_CHECKING
+from typing import Optional, Dict, List, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import smtplib
+    from email.message import EmailMessage
     from fitparse import FitFile  # type: ignore
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk  # messagebox and textwrap are imported where a dialog is shown
 
-# Optional TLS trust improvements on some Python installs
 try:
     from fitparse import FitFile  # type: ignore
     FITPARSE_OK = True
 except ImportError:
     FITPARSE_OK = False
 
+# Optional fast JSON encoder for profile writes
 try:
-    import certifi
-    CERT_BUNDLE = certifi.where()
-except Exception:
-    CERT_BUNDLE = None
+    import orjson  # type: ignore
+    ORJSON_OK = True
+except ImportError:
+    ORJSON_OK = False
+
+# The email, TLS and XML stacks are imported where they are first used: the app
+# sits idle until Ready is clicked or a watch is attached, so cold start doesn't pay for them.
+_UNSET = object()
+CERT_BUNDLE = _UNSET
+
+def _cert_bundle() -> Optional[str]:
+    """Optional TLS trust improvements on some Python installs (resolved on first send)."""
+    global CERT_BUNDLE
+    if CERT_BUNDLE is _UNSET:
+        try:
+            import certifi
+            CERT_BUNDLE = certifi.where()
+        except Exception:
+            CERT_BUNDLE = None
+    return CERT_BUNDLE  # type: ignore[return-value]
+
+_SSL_CONTEXT = None
+
+def _ssl_context():
+    """One client SSLContext for every connection: the CA bundle is parsed once, and TLS sessions can be resumed."""
+    global _SSL_CONTEXT
+    if _SSL_CONTEXT is None:
+        import ssl
+        cafile = _cert_bundle()
+        _SSL_CONTEXT = ssl.create_default_context(cafile=cafile) if cafile else ssl.create_default_context()
+    return _SSL_CONTEXT
 
 IS_WINDOWS = sys.platform.startswith("win")
 IS_MAC = (sys.platform == "darwin")
@@ -118,6 +151,7 @@ def get_app_version() -> str:
         return BUILD_VERSION
     
     # Otherwise fall back to git tags (for development)
+    import subprocess
     try:
         script_dir = Path(__file__).resolve().parent
         result = subprocess.run(
@@ -157,7 +191,8 @@ def load_config() -> dict:
     
     default_config = {
         "devmode": False,
-        "only_today": True
+        "only_today": True,
+        "use_fit_date": True
     }
     
     try:
@@ -194,10 +229,15 @@ LOGFILE  = BASE / "GarminMailer.log"
 CONF     = BASE / "mailer.conf.json"
 TEMPLATE = BASE / "mail-template.txt"
 DEVICES_DIR = BASE / "devices"
+DEVICES_DIR_STR = str(DEVICES_DIR)           # per-send profile paths are joined as plain strings
 LABELS_CSV = BASE / "watch-labels.csv"       # device_id,label
 DETECT_TIMEOUT = 30                          # seconds to wait for mount
+TEMPLATE_RECHECK = 2                         # seconds between mail-template mtime checks
+PICK_TIMEOUT = 180                           # seconds to wait for the file picker
+MOUNT_SETTLE = 5                             # seconds a new mount may take before its GARMIN folder is visible
+UI_DRAIN_BATCH = 32                          # worker messages handled per Tk callback
 
-EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}$")
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}")  # use with fullmatch()
 GARMIN_NS = {"g": "http://www.garmin.com/xmlschemas/GarminDevice/v2"}
 
 # Ensure base folders exist
@@ -207,11 +247,36 @@ for p in [BASE, SENT_ROOT, ARCHIVE_ROOT, DEVICES_DIR]:
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
+# Lines are handed to a QueueListener thread that owns the (rotating) log file,
+# so callers never wait on file I/O (AV scanners, synced Documents folders).
+LOG_MAX_BYTES = 5_000_000
+LOG_BACKUP_COUNT = 3
+
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+_log_file_handler = logging.handlers.RotatingFileHandler(
+        LOGFILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
+        )
+_log_file_handler.setFormatter(logging.Formatter("%(message)s"))
+_LOG_LISTENER = logging.handlers.QueueListener(_log_queue, _log_file_handler)
+_LOG_LISTENER.start()
+atexit.register(_LOG_LISTENER.stop)  # flushes queued lines before exit
+
+_logger = logging.getLogger("garmin_mailer")
+_logger.setLevel(logging.INFO)
+_logger.propagate = False
+_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+def log_lines(msgs: List[str]) -> None:
+    """Log several lines under one timestamp as a single record, i.e. one write to the file."""
+    if not msgs:
+        return
+    stamp = f"{datetime.now():%Y-%m-%d %H:%M:%S}"
+    text = "\n".join(f"{stamp}  {msg}" for msg in msgs)
+    print(text)
+    _logger.info(text)
+
 def log_line(msg: str) -> None:
-    line = f"{datetime.now():%Y-%m-%d %H:%M:%S}  {msg}"
-    print(line)
-    with LOGFILE.open("a", encoding="utf-8") as f:
-        f.write(line + "\n")
+    log_lines([msg])
 
 # ---------------------------------------------------------------------------
 # First-run file creation
@@ -261,233 +326,667 @@ def read_config() -> dict:
             raise RuntimeError(f"Config missing key: {k}")
     return data
 
-def read_mail_body_with_name(name: str) -> str:
+class MailTemplate:
     """
-    Read template; replace {name} if present. If not present, content is unchanged.
+    mail-template.txt, read once per App and re-read only when its mtime changes.
+    The mtime is checked at most every TEMPLATE_RECHECK seconds, so edits still
+    take effect without a file read per watch.
     """
-    ensure_template_exists()
-    try:
-        body = TEMPLATE.read_text(encoding="utf-8")
+    FALLBACK = "Hi {name},\n\nAttached is the latest Garmin FIT file.\n\n- Garmin Mailer"
+
+    def __init__(self):
+        self._text: Optional[str] = None
+        self._mtime: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def text(self) -> str:
+        with self._lock:
+            now = time.monotonic()
+            if self._text is not None and now - self._checked_at < TEMPLATE_RECHECK:
+                return self._text
+            self._checked_at = now
+            ensure_template_exists()
+            try:
+                mtime = TEMPLATE.stat().st_mtime_ns
+                if self._text is None or mtime != self._mtime:
+                    self._text = TEMPLATE.read_text(encoding="utf-8")
+                    self._mtime = mtime
+            except Exception:
+                self._text, self._mtime = self.FALLBACK, None
+            return self._text
+
+    def render(self, name: str) -> str:
+        """Template with {name} replaced if present. If not present, content is unchanged."""
+        body = self.text()
         if "{name}" in body:
             return body.replace("{name}", name)
         return body
-    except Exception:
-        fallback = "Hi {name},\n\nAttached is the latest Garmin FIT file.\n\n- Garmin Mailer"
-        return fallback.replace("{name}", name) if "{name}" in fallback else fallback
+
+# watch-labels.csv rarely changes during a session: reuse the parsed map until its mtime moves
+_labels_cache: dict = {"mtime": None, "map": {}}
+_labels_lock = threading.Lock()
 
 def load_labels_map() -> dict:
     ensure_labels_csv_exists()
-    mapping = {}
-    try:
-        with LABELS_CSV.open("r", encoding="utf-8") as f:
-            for raw in f:
-                line = raw.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if line.lower().startswith("device_id,"):
-                    continue
-                parts = [p.strip() for p in line.split(",")]
-                if len(parts) >= 2:
-                    did, lab = parts[0], parts[1]
-                    if did and lab:
-                        mapping[did] = lab
-    except Exception:
-        pass
-    return mapping
+    with _labels_lock:
+        try:
+            mtime = LABELS_CSV.stat().st_mtime_ns
+        except OSError:
+            mtime = -1
+        if mtime == _labels_cache["mtime"]:
+            return _labels_cache["map"]
+
+        mapping = {}
+        try:
+            with LABELS_CSV.open("r", encoding="utf-8", newline="") as f:
+                for row in csv.reader(f):
+                    if not row:
+                        continue
+                    did = row[0].strip()
+                    if not did or did.startswith("#") or did.lower() == "device_id":
+                        continue
+                    if len(row) >= 2:
+                        lab = row[1].strip()
+                        if lab:
+                            mapping[did] = lab
+        except Exception:
+            pass
+        _labels_cache["mtime"] = mtime
+        _labels_cache["map"] = mapping
+        return mapping
 
 # ---------------------------------------------------------------------------
 # Utility
 # ---------------------------------------------------------------------------
+# Every byte outside [A-Za-z0-9._-]; dropped with bytes.translate (non-ASCII is dropped by the encode)
+_FILENAME_KEEP = (string.ascii_letters + string.digits + "._-").encode("ascii")
+_FILENAME_DELETE = bytes(b for b in range(256) if b not in _FILENAME_KEEP)
+
+def _keep_filename_chars(text: str) -> str:
+    return text.encode("ascii", "ignore").translate(None, _FILENAME_DELETE).decode("ascii")
+
 def sanitize_email_for_filename(email: str) -> str:
-    email_at = email.replace("@", "-at-")
-    return re.sub(r"[^A-Za-z0-9._-]", "", email_at)
+    return _keep_filename_chars(email.replace("@", "-at-"))
 
 def sanitize_name(name: str) -> str:
-    no_spaces = re.sub(r"\s+", "", name.strip())
-    return re.sub(r"[^A-Za-z0-9._-]", "", no_spaces)
+    return _keep_filename_chars("".join(name.split()))
+
+def write_device_profile(dev_id_for_fs: str, prof: dict) -> None:
+    """
+    Write devices/<device_id>/profile.json via a temp file + os.replace, so an
+    interrupted write never leaves a truncated profile behind. The file is only
+    read by this app, so it is stored compact, and left untouched (mtime included)
+    when the bytes would not change.
+    """
+    path = os.path.join(DEVICES_DIR_STR, dev_id_for_fs, "profile.json")
+    tmp = path + ".tmp"
+    if ORJSON_OK:
+        data = orjson.dumps(prof)
+    else:
+        data = json.dumps(prof, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return
+    except OSError:
+        pass  # not written yet
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
 
 # ---------------------------------------------------------------------------
 # Garmin device info
 # ---------------------------------------------------------------------------
+# Clark-notation tags as iterparse reports them, built once
+_GARMIN_NS_PREFIX = "{" + GARMIN_NS["g"] + "}"
+_DEVICE_ID_TAG = _GARMIN_NS_PREFIX + "Id"
+_DEVICE_MODEL_TAG = _GARMIN_NS_PREFIX + "Model"
+_DEVICE_DESC_TAG = _GARMIN_NS_PREFIX + "Description"
+
 def parse_garmin_device_xml(root_dir: Path) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Read <Id> and <Model><Description> from GARMIN/GarminDevice.xml.
+    Streams the file with iterparse and stops as soon as both are seen, instead
+    of building the whole tree.
+    """
     dev_xml = root_dir / "GARMIN" / "GarminDevice.xml"
+    import xml.etree.ElementTree as ET
+
+    id_tag, model_tag, desc_tag = _DEVICE_ID_TAG, _DEVICE_MODEL_TAG, _DEVICE_DESC_TAG
+    device_id: Optional[str] = None
+    model: Optional[str] = None
+    stack: List[str] = []
     try:
-        if dev_xml.exists():
-            tree = ET.parse(dev_xml)
-            root = tree.getroot()
-            device_id_el = root.find("g:Id", GARMIN_NS)
-            model_el = root.find("g:Model/g:Description", GARMIN_NS)
-            return (
-                    device_id_el.text if device_id_el is not None else None,
-                    model_el.text if model_el is not None else None,
-                    )
+        # Our own file object: breaking out of iterparse would otherwise leave the
+        # file on the watch open until GC, and the eject that follows the copy would be refused
+        with open(dev_xml, "rb") as f:
+            for event, el in ET.iterparse(f, events=("start", "end")):
+                if event == "start":
+                    stack.append(el.tag)
+                    continue
+                depth = len(stack)  # 1 = document root
+                if depth == 2 and el.tag == id_tag:
+                    device_id = el.text
+                elif depth == 3 and el.tag == desc_tag and stack[1] == model_tag:
+                    model = el.text
+                stack.pop()
+                if depth > 1:
+                    el.clear()
+                if device_id is not None and model is not None:
+                    break
     except Exception:
         pass
-    return (None, None)
+    return (device_id, model)
 
 # ---------------------------------------------------------------------------
 # Instant volume scan (used for auto-start in Copy-only)
 # ---------------------------------------------------------------------------
-def find_current_garmin_volume() -> Optional[Path]:
-    """Return a mounted GARMIN volume if exactly one is present, else None."""
+DRIVE_REMOVABLE = 2
+
+def _win_removable_drives() -> List[str]:
+    """
+    Letters of present removable drives: one GetLogicalDrives() bitmask plus a
+    GetDriveTypeW() per present letter, instead of probing all 26 letters.
+    """
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+    except (ImportError, AttributeError):
+        return list(string.ascii_uppercase)  # not on Windows (dev runs): probe every letter
+    mask = kernel32.GetLogicalDrives()
+    letters = [chr(ord("A") + i) for i in range(26) if mask & (1 << i)]
+    return [c for c in letters if kernel32.GetDriveTypeW(f"{c}:\\") == DRIVE_REMOVABLE]
+
+def scan_garmin_volumes() -> List[Path]:
+    """Return every mounted volume that has a top-level GARMIN folder."""
     if IS_MAC:
         vols_root = Path("/Volumes")
         try:
-            cands = [e for e in vols_root.iterdir() if e.is_dir() and (e / "GARMIN").is_dir()]
+            return [e for e in vols_root.iterdir() if e.is_dir() and (e / "GARMIN").is_dir()]
         except Exception:
-            cands = []
-    else:
-        cands = []
-        for c in string.ascii_uppercase:
-            root = Path(f"{c}:\\")
-            try:
-                if root.exists() and (root / "GARMIN").is_dir():
-                    cands.append(root)
-            except Exception:
-                pass
+            return []
+    cands: List[Path] = []
+    for c in _win_removable_drives():
+        try:
+            if os.path.isdir(f"{c}:\\GARMIN"):
+                cands.append(Path(f"{c}:\\"))
+        except Exception:
+            pass
+    return cands
+
+def find_current_garmin_volume() -> Optional[Path]:
+    """Return a mounted GARMIN volume if exactly one is present, else None."""
+    cands = scan_garmin_volumes()
     return cands[0] if len(cands) == 1 else None
 
+def _mount_signature() -> Optional[object]:
+    """
+    Cheap token that changes whenever the set of mounted volumes does: the mtime of
+    /Volumes plus each entry's name and st_dev on macOS (st_dev changes when a file
+    system is mounted over an entry that already existed), the GetLogicalDrives()
+    bitmask on Windows. None = unknown. Nothing below the mount points is touched.
+    """
+    if IS_MAC:
+        try:
+            entries = []
+            with os.scandir("/Volumes") as it:
+                for e in it:
+                    try:
+                        dev = e.stat().st_dev
+                    except OSError:
+                        dev = -1
+                    entries.append((e.name, dev))
+            return (os.stat("/Volumes").st_mtime_ns, tuple(sorted(entries)))
+        except OSError:
+            return None
+    if IS_WINDOWS:
+        try:
+            import ctypes
+            return ctypes.windll.kernel32.GetLogicalDrives()  # type: ignore[attr-defined]
+        except (ImportError, AttributeError, OSError):
+            return None
+    return None
+
+class VolumeScanCache:
+    """
+    Memoizes find_current_garmin_volume() for the archive-only watch: the full scan
+    only reruns when _mount_signature() changes (or can't be determined). A "no watch"
+    result is not trusted for MOUNT_SETTLE seconds after a change, since the scan may
+    have raced a mount that is still in progress.
+    """
+    def __init__(self):
+        self._sig: Optional[object] = None
+        self._vol: Optional[Path] = None
+        self._changed_at = 0.0
+
+    def invalidate(self) -> None:
+        """Forget the last scan (a run is starting and may eject the volume)."""
+        self._sig = None
+
+    def current(self) -> Optional[Path]:
+        sig = _mount_signature()
+        now = time.monotonic()
+        if sig is None or sig != self._sig:
+            self._changed_at = now
+        elif self._vol is not None or now - self._changed_at >= MOUNT_SETTLE:
+            return self._vol
+        self._vol = find_current_garmin_volume()
+        self._sig = sig
+        return self._vol
+
 # ---------------------------------------------------------------------------
 # Single-watch detection (USB Mass Storage only)
 # ---------------------------------------------------------------------------
-def mac_find_single_volume(deadline: float, tick_cb) -> Optional[Path]:
-    vols_root = Path("/Volumes")
+def _wait_for_single_volume(deadline: float, tick_cb, wait_for_change,
+                            cancel_event: Optional[threading.Event] = None) -> Optional[Path]:
+    """
+    Rescan whenever wait_for_change(timeout) returns (mount event or timeout; its result is ignored).
+    Waits never run past the next whole second, so tick_cb fires at 1 Hz and a
+    set cancel_event ends the wait within a second.
+    """
     last_left = 10**9
-    while time.time() < deadline:
-        left = int(deadline - time.time())
+    while True:
+        if cancel_event is not None and cancel_event.is_set():
+            return None
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            break
+        left = int(remaining)
         if left != last_left:
             tick_cb(max(0, left))
             last_left = left
 
-        if not vols_root.exists():
-            time.sleep(0.25)
-            continue
-        candidates = []
-        try:
-            for entry in vols_root.iterdir():
-                if entry.is_dir() and (entry / "GARMIN").is_dir():
-                    candidates.append(entry)
-        except PermissionError:
-            pass
-
-        if len(candidates) == 1:
-            return candidates[0]
-        if len(candidates) > 1:
-            time.sleep(0.25)
-            continue
+        vol = find_current_garmin_volume()
+        if vol is not None:
+            return vol
 
-        time.sleep(0.25)
+        wait_for_change(min(remaining, (remaining - left) or 1.0))
     tick_cb(0)
     return None
 
-def win_find_single_root(deadline: float, tick_cb) -> Optional[Path]:
-    last_left = 10**9
-    while time.time() < deadline:
-        left = int(deadline - time.time())
-        if left != last_left:
-            tick_cb(max(0, left))
-            last_left = left
+def poll_for_single_volume(deadline: float, tick_cb, cancel_event: Optional[threading.Event] = None) -> Optional[Path]:
+    """Fallback when no mount notifications are available: rescan every 0.5 s (the countdown shows whole seconds)."""
+    return _wait_for_single_volume(deadline, tick_cb, lambda timeout: time.sleep(min(timeout, 0.5)), cancel_event)
 
-        candidates: List[Path] = []
-        for c in string.ascii_uppercase:
-            root = Path(f"{c}:\\")
-            try:
-                if root.exists() and (root / "GARMIN").is_dir():
-                    candidates.append(root)
-            except Exception:
-                pass
+class MountWatcher:
+    """
+    Waits on OS mount notifications instead of polling:
+      - macOS: kqueue vnode events on /Volumes
+      - Windows: WM_DEVICECHANGE on a message-only window (GUID_DEVINTERFACE_VOLUME)
+    wait_for_garmin() blocks for exactly one GARMIN volume (Worker detection);
+    watch_changes() reports every mount/unmount until cancel_event is set (the
+    archive-only auto-start). Every wake-up runs the same scans as the polling
+    path, which remains the fallback.
+    """
+    def __init__(self, cancel_event: Optional[threading.Event] = None):
+        self.cancel_event = cancel_event
+
+    def _notifier(self):
+        """with_notifications(fn) for this platform, or None. fn gets wait_for_change(timeout) -> changed."""
+        if IS_MAC:
+            return self._with_kqueue
+        if IS_WINDOWS:
+            return self._with_devicechange
+        return None
 
-        if len(candidates) == 1:
-            return candidates[0]
-        if len(candidates) > 1:
-            time.sleep(0.25)
-            continue
+    def wait_for_garmin(self, deadline: float, tick_cb) -> Optional[Path]:
+        notifier = self._notifier()
+        if notifier is not None:
+            try:
+                return notifier(lambda wait_for_change: _wait_for_single_volume(
+                        deadline, tick_cb, wait_for_change, self.cancel_event))
+            except Exception as e:
+                log_line(f"MOUNT_WATCH  notifications unavailable, polling instead: {e}")
+        return poll_for_single_volume(deadline, tick_cb, self.cancel_event)
 
-        time.sleep(0.25)
-    tick_cb(0)
-    return None
+    def watch_changes(self, on_change) -> None:
+        """
+        Call on_change() (from this thread) after each mount/unmount, and once a second
+        for MOUNT_SETTLE seconds after it (the event can arrive before the mount is
+        complete), until cancel_event is set; blocks, so run it on its own thread.
+        Without notifications the mount signature is compared once a second, and an
+        unknown signature counts as a change.
+        """
+        stop = self.cancel_event or threading.Event()
+
+        def loop(wait_for_change) -> None:
+            settle_until = 0.0
+            while not stop.is_set():
+                if wait_for_change(1.0):
+                    settle_until = time.monotonic() + MOUNT_SETTLE
+                    on_change()
+                elif time.monotonic() < settle_until:
+                    on_change()
+
+        notifier = self._notifier()
+        if notifier is not None:
+            try:
+                notifier(loop)
+                return
+            except Exception as e:
+                log_line(f"MOUNT_WATCH  notifications unavailable, polling instead: {e}")
+        last = _mount_signature()
+        settle_until = 0.0
+        while not stop.wait(1.0):
+            sig = _mount_signature()
+            if sig is None or sig != last:
+                last = sig
+                settle_until = time.monotonic() + MOUNT_SETTLE
+                on_change()
+            elif time.monotonic() < settle_until:
+                on_change()
+
+    def _with_kqueue(self, fn):
+        import select
+        fd = os.open("/Volumes", getattr(os, "O_EVTONLY", os.O_RDONLY))
+        kq = select.kqueue()
+        try:
+            ev = select.kevent(
+                    fd,
+                    filter=select.KQ_FILTER_VNODE,
+                    flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                    fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND | select.KQ_NOTE_LINK,
+                    )
+            kq.control([ev], 0, 0)
+            return fn(lambda timeout: bool(kq.control(None, 1, timeout)))
+        finally:
+            kq.close()
+            os.close(fd)
+
+    def _with_devicechange(self, fn):
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+        LRESULT = ctypes.c_ssize_t
+        WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+        HWND_MESSAGE = wintypes.HWND(-3)
+        DBT_DEVTYP_DEVICEINTERFACE = 5
+        DEVICE_NOTIFY_WINDOW_HANDLE = 0
+        QS_ALLINPUT = 0x04FF
+        PM_REMOVE = 0x0001
+        WM_DEVICECHANGE = 0x0219
+
+        class GUID(ctypes.Structure):
+            _fields_ = [("Data1", wintypes.DWORD), ("Data2", wintypes.WORD),
+                        ("Data3", wintypes.WORD), ("Data4", ctypes.c_ubyte * 8)]
+
+        class DEV_BROADCAST_DEVICEINTERFACE_W(ctypes.Structure):
+            _fields_ = [("dbcc_size", wintypes.DWORD), ("dbcc_devicetype", wintypes.DWORD),
+                        ("dbcc_reserved", wintypes.DWORD), ("dbcc_classguid", GUID),
+                        ("dbcc_name", wintypes.WCHAR * 1)]
+
+        class WNDCLASSW(ctypes.Structure):
+            _fields_ = [("style", wintypes.UINT), ("lpfnWndProc", WNDPROC),
+                        ("cbClsExtra", ctypes.c_int), ("cbWndExtra", ctypes.c_int),
+                        ("hInstance", wintypes.HINSTANCE), ("hIcon", wintypes.HICON),
+                        ("hCursor", wintypes.HANDLE), ("hbrBackground", wintypes.HBRUSH),
+                        ("lpszMenuName", wintypes.LPCWSTR), ("lpszClassName", wintypes.LPCWSTR)]
+
+        user32.DefWindowProcW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        user32.DefWindowProcW.restype = LRESULT
+        user32.CreateWindowExW.argtypes = [wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+                                           ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                                           wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID]
+        user32.CreateWindowExW.restype = wintypes.HWND
+        user32.RegisterDeviceNotificationW.argtypes = [wintypes.HANDLE, wintypes.LPVOID, wintypes.DWORD]
+        user32.RegisterDeviceNotificationW.restype = wintypes.HANDLE
+        user32.UnregisterDeviceNotification.argtypes = [wintypes.HANDLE]
+        user32.MsgWaitForMultipleObjects.argtypes = [wintypes.DWORD, wintypes.LPVOID, wintypes.BOOL,
+                                                     wintypes.DWORD, wintypes.DWORD]
+        user32.PeekMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND,
+                                        wintypes.UINT, wintypes.UINT, wintypes.UINT]
+        kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+
+        changed = [False]
+
+        def wndproc(hwnd, msg, wparam, lparam):
+            # WM_DEVICECHANGE (arrival/removal) only needs to be noted; the rescan decides what changed
+            if msg == WM_DEVICECHANGE:
+                changed[0] = True
+            return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+        proc = WNDPROC(wndproc)  # keep a reference for the window's lifetime
+        hinst = kernel32.GetModuleHandleW(None)
+        class_name = f"GarminMailerMountWatcher{threading.get_ident()}"
+        wc = WNDCLASSW(lpfnWndProc=proc, hInstance=hinst, lpszClassName=class_name)
+        if not user32.RegisterClassW(ctypes.byref(wc)):
+            raise ctypes.WinError(ctypes.get_last_error())
+        hwnd = None
+        hnotify = None
+        try:
+            hwnd = user32.CreateWindowExW(0, class_name, "", 0, 0, 0, 0, 0, HWND_MESSAGE, None, hinst, None)
+            if not hwnd:
+                raise ctypes.WinError(ctypes.get_last_error())
+
+            flt = DEV_BROADCAST_DEVICEINTERFACE_W()
+            flt.dbcc_size = ctypes.sizeof(DEV_BROADCAST_DEVICEINTERFACE_W)
+            flt.dbcc_devicetype = DBT_DEVTYP_DEVICEINTERFACE
+            # GUID_DEVINTERFACE_VOLUME {53F5630D-B6BF-11D0-94F2-00A0C91EFB8B}
+            flt.dbcc_classguid = GUID(0x53F5630D, 0xB6BF, 0x11D0,
+                                      (ctypes.c_ubyte * 8)(0x94, 0xF2, 0x00, 0xA0, 0xC9, 0x1E, 0xFB, 0x8B))
+            hnotify = user32.RegisterDeviceNotificationW(hwnd, ctypes.byref(flt), DEVICE_NOTIFY_WINDOW_HANDLE)
+            if not hnotify:
+                raise ctypes.WinError(ctypes.get_last_error())
+
+            msg = wintypes.MSG()
+
+            def wait_for_change(timeout: float) -> bool:
+                changed[0] = False
+                user32.MsgWaitForMultipleObjects(0, None, False, int(timeout * 1000), QS_ALLINPUT)
+                while user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_REMOVE):
+                    user32.TranslateMessage(ctypes.byref(msg))
+                    user32.DispatchMessageW(ctypes.byref(msg))
+                return changed[0]
+
+            return fn(wait_for_change)
+        finally:
+            if hnotify:
+                user32.UnregisterDeviceNotification(hnotify)
+            if hwnd:
+                user32.DestroyWindow(hwnd)
+            user32.UnregisterClassW(class_name, hinst)
 
 # ---------------------------------------------------------------------------
 # FIT file helpers
 # ---------------------------------------------------------------------------
-def list_fit_files(root: Path) -> List[Path]:
+@dataclass(frozen=True, slots=True)
+class FitEntry:
+    """A FIT file on the watch with the stat fields we need, read once while listing."""
+    path: Path
+    mtime: float
+    size: int
+
+def _scan_fit_folder(folder: Path, since_mtime: float = float("-inf"),
+                     until_mtime: float = float("inf")) -> List[FitEntry]:
     """
-    Return a list of .fit files found on the mounted Garmin volume.
-    Looks in:
+    All visible .fit files directly inside folder with since_mtime <= mtime < until_mtime;
+    [] if it is missing or unreadable.
+    """
+    found: List[FitEntry] = []
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith((".", "~")):
+                    continue
+                if not name.lower().endswith(".fit"):
+                    continue
+                try:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if not since_mtime <= st.st_mtime < until_mtime:
+                    continue
+                found.append(FitEntry(Path(entry.path), st.st_mtime, st.st_size))
+    except PermissionError:
+        pass
+    except Exception:
+        pass
+    return found
+
+def list_fit_files(root: Path, since_mtime: Optional[float] = None,
+                   until_mtime: Optional[float] = None) -> List[FitEntry]:
+    """
+    Return the .fit files found on the mounted Garmin volume, stat'ed once each.
+    Looks in (a name found in the first folder wins over the same name in the second):
         - <root>/GARMIN/Activity
       - <root>/Activity
+    since_mtime/until_mtime (epoch seconds) keep only files modified in [since, until),
+    checked against the scandir stat before any FitEntry is built.
     """
-    results: List[Path] = []
+    lo = float("-inf") if since_mtime is None else since_mtime
+    hi = float("inf") if until_mtime is None else until_mtime
+
+    def scan(folder: Path) -> List[FitEntry]:
+        return _scan_fit_folder(folder, lo, hi)
+
     candidates = [
             root / "GARMIN" / "Activity",
             root / "Activity",
             ]
+    present = [c for c in candidates if c.is_dir()]
+    if len(present) > 1:
+        # Cold directory reads over USB mass storage are I/O wait, so both folders can be read at once
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(present)) as ex:
+            scans = list(ex.map(scan, present))
+    else:
+        scans = [scan(c) for c in present]
+
+    results: List[FitEntry] = []
     seen = set()
-    for folder in candidates:
-        if not folder.is_dir():
-            continue
-        try:
-            for f in folder.iterdir():
-                if not f.is_file():
-                    continue
-                if f.name.startswith(".") or f.name.startswith("~"):
-                    continue
-                if f.suffix.lower() != ".fit":
-                    continue
-                key = str(f.resolve()) if f.exists() else str(f)
-                if key in seen:
-                    continue
-                seen.add(key)
-                results.append(f)
-        except PermissionError:
-            continue
-        except Exception:
-            continue
+    for found in scans:
+        for entry in found:
+            name = entry.path.name
+            if name in seen:
+                continue
+            seen.add(name)
+            results.append(entry)
     return results
 
+FIT_EPOCH = datetime(1989, 12, 31)           # FIT timestamps count seconds from UTC 1989-12-31 00:00
+FIT_HEAD_BYTES = 4096                        # file_id is the first data message; this is plenty
+FIT_MIN_DATE_TIME = 0x10000000               # smaller values are relative (system) times, not dates
+
+def _fit_file_id_time_created(buf) -> Optional[datetime]:
+    """
+    Decode time_created (naive UTC, like fitparse) from the file_id message at the
+    start of a FIT file. Returns None if the file_id carries no usable date; raises
+    ValueError if buf isn't a FIT prefix this minimal reader understands.
+    """
+    if len(buf) < 12 or buf[8:12] != b".FIT":
+        raise ValueError("not a FIT file")
+    pos = buf[0]                              # header size (12 or 14)
+    end = len(buf)
+    defs = {}                                 # local type -> (big_endian, global_num, [(field_num, size)], dev_bytes)
+    try:
+        while pos < end:
+            hdr = buf[pos]
+            pos += 1
+            if hdr & 0x80:                    # compressed-timestamp data message
+                local = (hdr >> 5) & 0x03
+            elif hdr & 0x40:                  # definition message
+                big = buf[pos + 1] == 1
+                global_num = int.from_bytes(buf[pos + 2:pos + 4], "big" if big else "little")
+                nfields = buf[pos + 4]
+                pos += 5
+                fields = [(buf[pos + 3 * i], buf[pos + 3 * i + 1]) for i in range(nfields)]
+                pos += 3 * nfields
+                dev_bytes = 0
+                if hdr & 0x20:                # developer fields follow
+                    ndev = buf[pos]
+                    pos += 1
+                    dev_bytes = sum(buf[pos + 3 * i + 1] for i in range(ndev))
+                    pos += 3 * ndev
+                defs[hdr & 0x0F] = (big, global_num, fields, dev_bytes)
+                continue
+            else:
+                local = hdr & 0x0F
+            big, global_num, fields, dev_bytes = defs[local]
+            if global_num == 0:               # file_id
+                for num, size in fields:
+                    if num == 4 and size == 4:  # time_created, uint32
+                        if pos + 4 > end:
+                            raise ValueError("truncated file_id")
+                        raw = int.from_bytes(buf[pos:pos + 4], "big" if big else "little")
+                        if raw == 0xFFFFFFFF or raw < FIT_MIN_DATE_TIME:
+                            return None
+                        return FIT_EPOCH + timedelta(seconds=raw)
+                    pos += size
+                return None
+            pos += sum(size for _, size in fields) + dev_bytes
+    except (IndexError, KeyError):
+        pass
+    raise ValueError("no file_id message in the FIT header")
+
+def fit_time_created(path: Path) -> Optional[datetime]:
+    """
+    Recording date of a FIT file from its file_id message, reading only the first
+    few KB instead of having fitparse decode the whole file. fitparse is only
+    used when the quick read can't make sense of the file.
+    """
+    try:
+        # Unbuffered: one read() syscall straight into the result, no BufferedReader copy.
+        # (An mmap would cost more syscalls than it saves for a 4 KB prefix.)
+        with path.open("rb", buffering=0) as f:
+            return _fit_file_id_time_created(f.read(FIT_HEAD_BYTES))
+    except ValueError:
+        pass
+    except OSError:
+        return None
+    if not FITPARSE_OK:
+        return None
+    try:
+        for record in FitFile(str(path)).get_messages('file_id'):
+            value = record.get_value('time_created')
+            if value:
+                return value if isinstance(value, datetime) else None
+    except Exception:
+        pass
+    return None
+
 # ---------------------------------------------------------------------------
 # Picker: multi-select with Time + Size
 # ---------------------------------------------------------------------------
 class FileChoiceDialog(tk.Toplevel):
-    @staticmethod
-    def choose(parent: tk.Tk, files: List[Path], archive_only_mode: bool, preselect_single: bool = False) -> Optional[List[Path]]:
-        dlg = FileChoiceDialog(parent, files, archive_only_mode, preselect_single)
-        parent.wait_window(dlg)
-        return dlg.selected
-
-    def __init__(self, parent: tk.Tk, files: List[Path], archive_only_mode: bool, preselect_single: bool = False):
+    """
+    Modal activity picker. The App builds it once and keeps it withdrawn between
+    picks: reset() repopulates the tree, show_modal() runs it and returns the
+    chosen paths (None on cancel).
+    """
+    def __init__(self, parent: tk.Tk):
         super().__init__(parent)
-        if archive_only_mode:
-            self.title("Choose activities to archive")
-            dialog_text = "Select one or more activities to archive (Cmd/Ctrl-click or Shift-click):"
-        else:
-            self.title("Choose today's activities")
-            dialog_text = "Multiple activities found for today. Select which file(s) to email (Cmd/Ctrl-click or Shift-click):"
-
+        self.withdraw()
         self.resizable(True, True)  # Allow resizing for many files
         self.selected: Optional[List[Path]] = None
-        
+        self._paths: List[Path] = []  # row iid is the index as a string
+        self._closed = tk.BooleanVar(self, value=False)
+
         # Set minimum size
         self.minsize(400, 300)
 
         frm = ttk.Frame(self, padding=12)
         frm.pack(fill="both", expand=True)
 
-        ttk.Label(
-                frm, text=dialog_text
-        ).pack(anchor="w", pady=(0, 8))
+        self._label = ttk.Label(frm)
+        self._label.pack(anchor="w", pady=(0, 8))
 
         columns = ("filename", "size")
 
         # Create frame for treeview with scrollbars
         tree_frame = ttk.Frame(frm)
         tree_frame.pack(fill="both", expand=True, pady=(0, 8))
-        
-        tree = ttk.Treeview(
+
+        tree = self.tree = ttk.Treeview(
                 tree_frame,
                 columns=columns,
                 show="headings",
-                height=min(15, max(5, len(files))),  # Min 5, max 15 rows visible
+                height=5,
                 selectmode="extended"
         )
 
@@ -495,70 +994,229 @@ class FileChoiceDialog(tk.Toplevel):
         v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
         h_scrollbar = ttk.Scrollbar(tree_frame, orient="horizontal", command=tree.xview)
         tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        
+
         tree.heading("filename", text="Filename")
         tree.heading("size", text="Size")
         tree.column("filename", width=200, anchor="w")  # ~25 characters wide, left-aligned
         tree.column("size", width=80, anchor="center")
 
-        files_sorted = sorted(files, key=lambda p: p.stat().st_mtime)
-        self._iid_to_path: dict[str, Path] = {}
-
-        def fmt_size(n: int) -> str:
-            if n >= 1024 * 1024:
-                return f"{n / (1024*1024):.1f} MB"
-            if n >= 1024:
-                return f"{n / 1024:.0f} KB"
-            return f"{n} B"
-
-        for f in files_sorted:
-            size = fmt_size(f.stat().st_size)
-            filename = f.name  # Just the filename, not full path
-            iid = tree.insert("", "end", values=(filename, size))
-
-            # Pre-select the item if preselect_single is True
-            if preselect_single:
-                tree.selection_set(iid)
-            self._iid_to_path[iid] = f
-
         # Pack tree and scrollbars
         tree.grid(row=0, column=0, sticky="nsew")
         v_scrollbar.grid(row=0, column=1, sticky="ns")
         h_scrollbar.grid(row=1, column=0, sticky="ew")
-        
+
         # Configure grid weights for proper resizing
         tree_frame.grid_rowconfigure(0, weight=1)
         tree_frame.grid_columnconfigure(0, weight=1)
 
-        def finalize_selection():
-            sels = tree.selection()
-            if not sels:
-                messagebox.showinfo("Garmin Mailer", "Please select at least one activity.")
-                return
-            self.selected = [self._iid_to_path[i] for i in sels]
-            self.destroy()
-
-        tree.bind("<Double-1>", lambda _e: finalize_selection())
+        tree.bind("<Double-1>", lambda _e: self._finalize_selection())
 
         btns = ttk.Frame(frm)
         btns.pack(fill="x", pady=(10, 0))
-        ttk.Button(btns, text="Cancel", command=self.destroy).pack(side="right", padx=(6, 0))
-        ttk.Button(btns, text="Select", command=finalize_selection).pack(side="right")
+        ttk.Button(btns, text="Cancel", command=self._close).pack(side="right", padx=(6, 0))
+        ttk.Button(btns, text="Select", command=self._finalize_selection).pack(side="right")
 
-        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self._close)
+        # Closing the App mid-pick destroys us; end the modal wait too
+        self.bind("<Destroy>", lambda e: self._closed.set(True) if e.widget is self else None)
         self.transient(parent)
+
+    def reset(self, files: List[FitEntry], archive_only_mode: bool, preselect_single: bool = False) -> None:
+        if archive_only_mode:
+            self.title("Choose activities to archive")
+            dialog_text = "Select one or more activities to archive (Cmd/Ctrl-click or Shift-click):"
+        else:
+            self.title("Choose today's activities")
+            dialog_text = "Multiple activities found for today. Select which file(s) to email (Cmd/Ctrl-click or Shift-click):"
+        self._label.configure(text=dialog_text)
+        self.selected = None
+
+        files_sorted = sorted(files, key=attrgetter("mtime"))
+        self._paths = [f.path for f in files_sorted]
+
+        def fmt_size(n: int) -> str:
+            if n >= 1024 * 1024:
+                return f"{n / (1024*1024):.1f} MB"
+            if n >= 1024:
+                return f"{n / 1024:.0f} KB"
+            return f"{n} B"
+
+        # The dialog is withdrawn while rows change, so Tk lays the tree out once on show;
+        # explicit iids skip Tk's id allocation and map straight back to self._paths.
+        tree = self.tree
+        tree.delete(*tree.get_children())
+        tree.configure(height=min(15, max(5, len(files_sorted))))  # Min 5, max 15 rows visible
+        insert = tree.insert
+        for i, f in enumerate(files_sorted):
+            insert("", "end", iid=str(i), values=(f.path.name, fmt_size(f.size)))
+
+        # Pre-select the item if preselect_single is True (callers only ask for it with one row)
+        if preselect_single and files_sorted:
+            tree.selection_set(str(len(files_sorted) - 1))
+
+    def show_modal(self) -> Optional[List[Path]]:
+        self._closed.set(False)
+        self.deiconify()
         self.wait_visibility()
+        self.grab_set()
         self.focus()
         self.lift()
+        self.wait_variable(self._closed)
+        return self.selected
+
+    def _finalize_selection(self) -> None:
+        from tkinter import messagebox
+        sels = self.tree.selection()
+        if not sels:
+            messagebox.showinfo("Garmin Mailer", "Please select at least one activity.", parent=self)
+            return
+        self.selected = [self._paths[int(i)] for i in sels]
+        self._close()
+
+    def _close(self) -> None:
+        self.grab_release()
+        self.withdraw()
+        self._closed.set(True)
 
 # ---------------------------------------------------------------------------
 # Email (supports multiple attachments, S1 subject style)
 # ---------------------------------------------------------------------------
-def send_email_gmail(conf: dict, to_addr: str, attachments: List[Path], body_text: str) -> None:
+SMTP_MAX_MESSAGES_PER_CONNECTION = 100       # reconnect after this many sends (provider limits)
+SMTP_IDLE_TIMEOUT = 300                      # seconds; servers drop idle sessions, don't even try NOOP after this
+SMTP_SOCKET_TIMEOUT = 30                     # seconds per blocking socket op: a half-open session fails instead of hanging
+
+class SmtpSession:
+    """
+    Long-lived SMTP connection shared by successive Worker runs.
+    Connects lazily, checks the session with NOOP before each send and
+    reconnects when the server dropped it, the account changed, the
+    per-connection message cap was reached, or it sat idle past idle_timeout.
+    """
+    def __init__(self, max_messages: int = SMTP_MAX_MESSAGES_PER_CONNECTION,
+                 idle_timeout: float = SMTP_IDLE_TIMEOUT):
+        self.smtp: "Optional[smtplib.SMTP]" = None
+        self.key: Optional[Tuple[str, int, str]] = None
+        self.sent_count = 0
+        self.max_messages = max_messages
+        self.idle_timeout = idle_timeout
+        self.last_used = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key_for(conf: dict) -> Tuple[str, int, str]:
+        return (conf["smtp_server"], int(conf["smtp_port"]), conf["username"])
+
+    def _connect(self, conf: dict) -> None:
+        import smtplib
+
+        smtp_server, smtp_port, username = self._key_for(conf)
+        ctx = _ssl_context()
+
+        if smtp_port == 587:
+            smtp = smtplib.SMTP(smtp_server, smtp_port, timeout=SMTP_SOCKET_TIMEOUT)
+            try:
+                smtp.starttls(context=ctx)
+                smtp.login(username, conf["password"])
+            except Exception:
+                smtp.close()
+                raise
+        elif smtp_port == 465:
+            smtp = smtplib.SMTP_SSL(smtp_server, smtp_port, context=ctx, timeout=SMTP_SOCKET_TIMEOUT)
+            try:
+                smtp.login(username, conf["password"])
+            except Exception:
+                smtp.close()
+                raise
+        else:
+            raise ValueError(f"Unsupported SMTP port: {smtp_port}. Only 465 (SSL) and 587 (STARTTLS) are supported.")
+
+        self.smtp = smtp
+        self.key = (smtp_server, smtp_port, username)
+        self.sent_count = 0
+
+    def _is_alive(self) -> bool:
+        import smtplib
+
+        if self.smtp is None:
+            return False
+        try:
+            code, _ = self.smtp.noop()
+        except (smtplib.SMTPException, OSError):
+            return False
+        return code == 250
+
+    def _close_locked(self) -> None:
+        if self.smtp is None:
+            return
+        try:
+            self.smtp.quit()
+        except Exception:
+            try:
+                self.smtp.close()
+            except Exception:
+                pass
+        self.smtp = None
+        self.key = None
+        self.sent_count = 0
+
+    def send(self, conf: dict, msg: "EmailMessage") -> None:
+        import smtplib
+
+        with self._lock:
+            max_messages = int(conf.get("max_messages_per_connection", self.max_messages))
+            idle = time.monotonic() - self.last_used > self.idle_timeout
+            if (self.key != self._key_for(conf) or self.sent_count >= max_messages
+                    or idle or not self._is_alive()):
+                self._close_locked()
+                self._connect(conf)
+            try:
+                self.smtp.send_message(msg)  # type: ignore[union-attr]
+            except smtplib.SMTPServerDisconnected:
+                # Server dropped us between NOOP and send: one retry on a fresh connection
+                self._close_locked()
+                self._connect(conf)
+                self.smtp.send_message(msg)  # type: ignore[union-attr]
+            except Exception:
+                self._close_locked()
+                raise
+            self.sent_count += 1
+            self.last_used = time.monotonic()
+
+    def close(self, timeout: float = 1.0) -> None:
+        """
+        QUIT the connection. Runs at exit: if a send still holds the lock after timeout
+        seconds, give up and let the socket close with the process rather than wait for it.
+        """
+        if not self._lock.acquire(timeout=timeout):
+            return
+        try:
+            self._close_locked()
+        finally:
+            self._lock.release()
+
+def _encode_file_base64(file_path: Path) -> str:
+    """
+    Base64 of a file, encoded straight from a read-only mmap so no raw bytes
+    copy of the file is held next to the encoded text.
+    """
+    import base64
+
+    with file_path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return base64.encodebytes(mm).decode("ascii")
+
+def send_email_gmail(conf: dict, to_addr: str, attachments: List[Path], body_text: str,
+                     session: Optional[SmtpSession] = None) -> None:
     """
     Send one email to to_addr with one or more attachments.
     Subject includes count if multiple attachments (S1).
+    Reuses the connection held by session when given; otherwise connects once and quits.
     """
+    from email.message import EmailMessage
+    from email.mime.base import MIMEBase
+
     count = len(attachments)
     if count <= 1:
         subject = f"Garmin FIT {datetime.now():%Y-%m-%d}"
@@ -571,41 +1229,98 @@ def send_email_gmail(conf: dict, to_addr: str, attachments: List[Path], body_tex
     msg["Subject"] = subject
     msg.set_content(body_text if body_text else "Attached is the latest Garmin FIT file(s).")
 
+    # Attachment parts are built directly with the C base64 encoder (76-char lines)
+    # instead of going through add_attachment's content-manager dispatch.
+    if attachments:
+        msg.make_mixed()
     for file_path in attachments:
-        data = file_path.read_bytes()
-        msg.add_attachment(
-                data,
-                maintype="application",
-                subtype="octet-stream",
-                filename=file_path.name
-                )
+        part = MIMEBase("application", "octet-stream")
+        part.set_payload(_encode_file_base64(file_path))
+        part["Content-Transfer-Encoding"] = "base64"
+        part.add_header("Content-Disposition", "attachment", filename=file_path.name)
+        msg.attach(part)
+
+    if session is not None:
+        session.send(conf, msg)
+        return
 
-    smtp_server = conf["smtp_server"]
-    smtp_port = int(conf["smtp_port"])
-    username = conf["username"]
-    password = conf["password"]
-
-    ctx = ssl.create_default_context(cafile=CERT_BUNDLE) if CERT_BUNDLE else ssl.create_default_context()
-
-    if smtp_port == 587:
-        with smtplib.SMTP(smtp_server, smtp_port) as smtp:
-            smtp.starttls(context=ctx)
-            smtp.login(username, password)
-            smtp.send_message(msg)
-    elif smtp_port == 465:
-        with smtplib.SMTP_SSL(smtp_server, smtp_port, context=ctx) as smtp:
-            smtp.login(username, password)
-            smtp.send_message(msg)
-    else:
-        raise ValueError(f"Unsupported SMTP port: {smtp_port}. Only 465 (SSL) and 587 (STARTTLS) are supported.")
+    one_shot = SmtpSession()
+    try:
+        one_shot.send(conf, msg)
+    finally:
+        one_shot.close()
 
 # ---------------------------------------------------------------------------
-# Background worker thread (no Tk calls inside; uses queues)
+# Background worker (runs on the App's single worker thread; no Tk calls inside; uses queues)
 # ---------------------------------------------------------------------------
-class Worker(threading.Thread):
+class DaemonExecutor:
+    """
+    Minimal executor whose long-lived threads are daemons: ThreadPoolExecutor joins its
+    threads at interpreter exit, so an in-flight send or eject would hold up quitting.
+    submit() returns a Future; the threads start on the first submit.
+    """
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self._max_workers = max_workers
+        self._name = thread_name_prefix
+        self._jobs: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._started = False
+        self._start_lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs) -> "concurrent.futures.Future":
+        fut: "concurrent.futures.Future" = concurrent.futures.Future()
+        self._jobs.put((fut, fn, args, kwargs))
+        if not self._started:
+            with self._start_lock:
+                if not self._started:
+                    for i in range(self._max_workers):
+                        threading.Thread(target=self._run_jobs, name=f"{self._name}_{i}", daemon=True).start()
+                    self._started = True
+        return fut
+
+    def _run_jobs(self) -> None:
+        while True:
+            fut, fn, args, kwargs = self._jobs.get()
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                fut.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                fut.set_exception(e)
+
+# Side I/O that can overlap with the Worker's main path (eject during send).
+# Two threads are plenty: these tasks spend their time waiting on the OS. Daemon
+# threads, so an eject or helper command still running never delays quitting.
+_IO_POOL = DaemonExecutor(max_workers=2, thread_name_prefix="garmin-io")
+# A run's bookkeeping (device profile, per-file log lines) is written after its DONE is
+# posted, so the UI settles first; a single thread keeps consecutive runs' records in order.
+_RECORD_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="garmin-record")
+
+def _record_run(dev_id_for_fs: str, prof: dict, make_log_lines) -> None:
+    try:
+        write_device_profile(dev_id_for_fs, prof)
+    except Exception:
+        pass
+    log_lines(make_log_lines())
+
+class Msg(IntEnum):
+    """
+    Worker -> UI message kinds. Messages are tuples (kind, *payload), handed over as-is:
+      COUNT     secs (None hides the countdown)
+      STEP      text, progress (int or None), spin (True on / False off / None unchanged)
+      DONE      text, progress, save_dir, mode ("EMAIL" or "ARCHIVE_ONLY")
+      ERROR     text
+      ASK_PICK  entries (List[FitEntry]), preselect_single
+    """
+    COUNT = 0
+    STEP = 1
+    DONE = 2
+    ERROR = 3
+    ASK_PICK = 4
+
+class Worker:
     """
     Steps:
-        1) Ensure first-run files (template, labels).
+        1) First-run files (template, labels) are ensured once by the App at launch.
       2) (If emailing) Load config.
       3) Wait up to DETECT_TIMEOUT for ONE Garmin device.
       4) Map device_id to label (if available).
@@ -617,15 +1332,16 @@ class Worker(threading.Thread):
     """
     def __init__(
             self,
-            ui_queue: "queue.Queue[str]",
+            ui_queue: "queue.Queue[tuple]",
             name_val: str,
             email_val: str,
             parent: tk.Tk,
             cancel_event: threading.Event,
             unmount_after_copy: bool,
             archive_only: bool,
+            smtp_session: Optional[SmtpSession] = None,
+            mail_template: Optional[MailTemplate] = None,
             ):
-        super().__init__(daemon=True)
         self.ui_queue = ui_queue
         self.name_val = name_val
         self.email_val = email_val
@@ -633,24 +1349,40 @@ class Worker(threading.Thread):
         self.cancel_event = cancel_event
         self.start_ts = time.time()
         self.labels_map = load_labels_map()
-        self.pick_reply_queue: "queue.Queue[List[str] | None]" = queue.Queue()
+        self._pick_event = threading.Event()
+        self._pick_result: Optional[List[Path]] = None
         self.unmount_after_copy = unmount_after_copy
         self.archive_only = archive_only
+        self.smtp_session = smtp_session
+        self.mail_template = mail_template or MailTemplate()
         self.saved_paths: List[Path] = []
 
-    def post(self, msg: str) -> None:
-        self.ui_queue.put(msg)
+    def post(self, kind: Msg, *payload) -> None:
+        # Once cancelled (Cancel button or window closing) only the final DONE/ERROR is worth a wake-up
+        if self.cancel_event.is_set() and kind is not Msg.DONE and kind is not Msg.ERROR:
+            return
+        self.ui_queue.put((kind, *payload))
+
+    def deliver_pick(self, selected_paths: Optional[List[Path]]) -> None:
+        """Called from the UI thread with the picker result (None = cancelled)."""
+        self._pick_result = selected_paths
+        self._pick_event.set()
 
     def _check_cancel(self) -> bool:
         if self.cancel_event.is_set():
-            self.post("ERROR|Cancelled by user.")
+            self.post(Msg.ERROR, "Cancelled by user.")
             return True
         return False
 
     def run(self) -> None:
-        ensure_template_exists()
-        ensure_labels_csv_exists()
+        try:
+            self._run()
+        except Exception as e:
+            # The pool would swallow this silently; surface it so the UI leaves the running state
+            log_line(f"ERROR  worker crashed: {e!r}")
+            self.post(Msg.ERROR, f"Unexpected error: {e}")
 
+    def _run(self) -> None:
         name = self.name_val.strip()
         email = self.email_val.strip()
         name_sane = sanitize_name(name) if name else ""
@@ -662,95 +1394,98 @@ class Worker(threading.Thread):
             try:
                 conf = read_config()
             except Exception as e:
-                self.post(f"ERROR|Config: {e}")
+                self.post(Msg.ERROR, f"Config: {e}")
                 return
 
         # Detect single watch (up to 30 seconds)
         if self._check_cancel():
             return
-        self.post("STEP|Detecting Garmin watch...|SPIN_ON")
-        self.post(f"COUNT|{DETECT_TIMEOUT}")
+        self.post(Msg.STEP, "Detecting Garmin watch...", None, True)
+        self.post(Msg.COUNT, DETECT_TIMEOUT)
 
         deadline = time.time() + DETECT_TIMEOUT
         def tick(n: int) -> None:
-            self.post(f"COUNT|{n}")
+            self.post(Msg.COUNT, n)
 
-        root = mac_find_single_volume(deadline, tick) if IS_MAC else win_find_single_root(deadline, tick)
+        root = MountWatcher(self.cancel_event).wait_for_garmin(deadline, tick)
 
         if self._check_cancel():
             return
 
         if not root:
-            self.post("STEP|Detection timed out.|SPIN_OFF")
-            self.post("COUNT|HIDE")
-            self.post("ERROR|❌ No Garmin watch detected. Connect the watch and press Retry.")
+            self.post(Msg.STEP, "Detection timed out.", None, False)
+            self.post(Msg.COUNT, None)
+            self.post(Msg.ERROR, "❌ No Garmin watch detected. Connect the watch and press Retry.")
             return
 
         device_id, model = parse_garmin_device_xml(root)
         label = self.labels_map.get(device_id or "", None)
         human_name = f"Garmin watch {label}" if label else "Garmin watch"
-        self.post("STEP|" + human_name + " found|SPIN_OFF")
-        self.post("COUNT|HIDE")
+        self.post(Msg.STEP, human_name + " found", None, False)
+        self.post(Msg.COUNT, None)
 
         # Per-device dir
         dev_id_for_fs = device_id or "unknown"
-        (DEVICES_DIR / dev_id_for_fs).mkdir(parents=True, exist_ok=True)
-
-        # List and decide files
-        files = list_fit_files(root)
+        os.makedirs(os.path.join(DEVICES_DIR_STR, dev_id_for_fs), exist_ok=True)
+
+        # List and decide files. Email mode with only_today lets the scan drop older files
+        # (local-midnight bounds as epoch floats: plain comparisons, no datetime per file).
+        only_today = not self.archive_only and CONFIG["only_today"]
+        if only_today:
+            today = date.today()
+            files = list_fit_files(root,
+                                   since_mtime=time.mktime(today.timetuple()),
+                                   until_mtime=time.mktime((today + timedelta(days=1)).timetuple()))
+            # A watch with no .fit files at all gets the plain message (and eject) below
+            if not files and list_fit_files(root):
+                self.post(Msg.ERROR, "No activity files from today were found on the watch.")
+                return
+        else:
+            files = list_fit_files(root)
         if not files:
             if self.unmount_after_copy:
                 mac_eject(root) if IS_MAC else win_eject_drive(root)
-            self.post("ERROR|No .fit files found on the watch.")
+            self.post(Msg.ERROR, "No .fit files found on the watch.")
             return
 
         # Selection logic
         if self.archive_only:
-            # Show ALL FIT files (sorted by mtime, newest first), let user multi-select
-            files_sorted = sorted(files, key=lambda p: p.stat().st_mtime, reverse=True)
-            if not files_sorted:
+            # Show ALL FIT files, let user multi-select (FileChoiceDialog orders rows by mtime itself)
+            if not files:
                 if self.unmount_after_copy:
                     mac_eject(root) if IS_MAC else win_eject_drive(root)
-                self.post("ERROR|No .fit files found on the watch.")
+                self.post(Msg.ERROR, "No .fit files found on the watch.")
                 return
             # Archive mode never pre-selects files (always shows multiple files)
-            self.post("ASK_PICK|" + json.dumps([str(p) for p in files_sorted]) + "|PRESELECT:False")
+            self.post(Msg.ASK_PICK, files, False)
             selected_paths = self._receive_pick_selection()
             if not selected_paths:
-                self.post("ERROR|No file selected.")
+                self.post(Msg.ERROR, "No file selected.")
                 return
         else:
-            # Email mode: filter files based on config setting
-            if CONFIG["only_today"]:
-                today_date = date.today()
-                todays_files = [f for f in files if datetime.fromtimestamp(f.stat().st_mtime).date() == today_date]
-                
-                if not todays_files:
-                    self.post("ERROR|No activity files from today were found on the watch.")
-                    return
-                
-                files_to_show = todays_files
-            else:
-                # Show all FIT files for selection
-                files_to_show = files
+            # Email mode: with only_today the listing already holds just today's files
+            files_to_show = files
 
             # Pre-select single file only in these specific conditions:
             # 1. only_today is enabled (showing today's files only)
             # 2. There's exactly one file to display
             # Otherwise, let user choose from multiple files
-            if CONFIG["only_today"] and len(files_to_show) == 1:
+            if only_today and len(files_to_show) == 1:
                 preselect_single = True
             else:
                 preselect_single = False
-            self.post("ASK_PICK|" + json.dumps([str(p) for p in files_to_show]) + f"|PRESELECT:{preselect_single}")
+            self.post(Msg.ASK_PICK, files_to_show, preselect_single)
             selected_paths = self._receive_pick_selection()
             if not selected_paths:
-                self.post("ERROR|No file was selected to email.")
+                self.post(Msg.ERROR, "No file was selected to email.")
                 return
 
-        selected = [Path(s) for s in selected_paths]
+        selected = selected_paths
+        mtimes = {e.path: e.mtime for e in files}
+        use_fit_date = bool(CONFIG.get("use_fit_date", True))
+        date_sources = {}  # src -> "fit" / "mtime", for the ARCHIVED log line
 
-        for src in selected:
+        def copy_one(src: Path) -> Path:
             # Determine the correct date string and save directory for each file.
             # In email mode, this is always today's date.
             # In archive mode, it's the activity date from the file.
@@ -767,46 +1502,47 @@ class Worker(threading.Thread):
                 # Archive mode: determine activity date from file for directory and filename
                 save_root = ARCHIVE_ROOT
                 # 1. Fallback to file modification date
-                activity_date_str = datetime.fromtimestamp(src.stat().st_mtime).strftime("%Y%m%d")
-                # 2. Try to get the actual recording date from the FIT file
-                if FITPARSE_OK:
-                    try:
-                        fitfile = FitFile(src)
-                        time_created = None
-                        for record in fitfile.get_messages('file_id'):
-                            if record.get_value('time_created'):
-                                time_created = record.get_value('time_created')
-                                break
-                        if time_created:
-                            activity_date_str = time_created.strftime("%Y%m%d")
-                    except Exception:
-                        pass # Fallback to file modification date on any parsing error
+                activity_date_str = datetime.fromtimestamp(mtimes.get(src) or src.stat().st_mtime).strftime("%Y%m%d")
+                date_sources[src] = "mtime"
+                # 2. Try to get the actual recording date from the FIT file (config: use_fit_date)
+                time_created = fit_time_created(src) if use_fit_date else None
+                if time_created:
+                    activity_date_str = time_created.strftime("%Y%m%d")
+                    date_sources[src] = "fit"
                 newname = f"{activity_date_str}_{label}_{src.name}" if label else f"{activity_date_str}_{src.name}"
 
             # Create the dated directory and define the final destination path
             save_dir = save_root / activity_date_str
             save_dir.mkdir(parents=True, exist_ok=True)
             dest = save_dir / newname
-            try:
-                dest.write_bytes(src.read_bytes())
-            except PermissionError:
-                tip = "Grant Full Disk Access to Terminal or Python in macOS System Settings."
-                self.post(f"ERROR|Permission denied reading FIT. {tip}")
-                return
-            except Exception as e:
-                self.post(f"ERROR|Copy failed: {e}")
-                return
-            self.saved_paths.append(dest)
+            shutil.copyfile(src, dest)  # sendfile/fcopyfile fast path, no full read into memory
+            return dest
 
-        # Eject after copy
-        eject_result = None
+        try:
+            if len(selected) > 1:
+                # Reads from the watch overlap with writes to Documents: copy a few files at once.
+                # map() keeps saved_paths in selection order.
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(4, len(selected)),
+                                                           thread_name_prefix="garmin-copy") as ex:
+                    self.saved_paths.extend(ex.map(copy_one, selected))
+            else:
+                self.saved_paths.extend(map(copy_one, selected))
+        except PermissionError:
+            tip = "Grant Full Disk Access to Terminal or Python in macOS System Settings."
+            self.post(Msg.ERROR, f"Permission denied reading FIT. {tip}")
+            return
+        except Exception as e:
+            self.post(Msg.ERROR, f"Copy failed: {e}")
+            return
+        save_dir = self.saved_paths[-1].parent
+
+        # Eject after copy, in the background: composing and sending the email only
+        # reads the copies under sent/, so it can overlap with the unmount.
+        eject_future = None
         # In Archive mode, always eject. In Email mode, respect the checkbox.
         should_eject = self.archive_only or self.unmount_after_copy
         if should_eject:
-            if IS_MAC:
-                eject_result = mac_eject(root)
-            else:
-                eject_result = win_eject_drive(root)
+            eject_future = _IO_POOL.submit(mac_eject if IS_MAC else win_eject_drive, root)
 
         # Email or archive-only completion
         if self.archive_only:
@@ -818,40 +1554,40 @@ class Worker(threading.Thread):
                     "last_action": "archive_only",
                     "last_time": datetime.now().isoformat(timespec="seconds"),
                     }
-            try:
-                (DEVICES_DIR / dev_id_for_fs / "profile.json").write_text(json.dumps(prof, indent=2), encoding="utf-8")
-            except Exception:
-                pass
-
             elapsed = int(time.time() - self.start_ts)
-            for src, dest in zip(selected, self.saved_paths):
-                log_line(
-                        f"ARCHIVED  label={(label or '')}  file={dest}  src={src.name}  "
-                        f"device_id={(device_id or '')}  model={model}  duration={elapsed}s  mode=ARCHIVE_ONLY"
-                        )
+            saved = list(self.saved_paths)
 
-            if eject_result:
+            if self._wait_eject(eject_future):
                 text = "Eject successful, please attach the next watch to the USB cable."
             else:
                 text = "Archive complete. Please eject and attach the next watch."
-            self.post("DONE|" + text + "|100|" + str(save_dir) + "|MODE:ARCHIVE_ONLY")
+            self.post(Msg.DONE, text, 100, save_dir, "ARCHIVE_ONLY")
+            _RECORD_POOL.submit(_record_run, dev_id_for_fs, prof, lambda: [
+                    f"ARCHIVED  label={(label or '')}  file={dest}  src={src.name}  "
+                    f"device_id={(device_id or '')}  model={model}  duration={elapsed}s  mode=ARCHIVE_ONLY  "
+                    f"date_from={date_sources.get(src, 'mtime')}"
+                    for src, dest in zip(selected, saved)
+                    ])
             return
 
         # Send single email with all attachments
         if self._check_cancel():
             return
-        body_text = read_mail_body_with_name(name)
-        self.post(f"STEP|Sending email... ({len(self.saved_paths)} attachment(s))|90")
+        import smtplib
+        import ssl
+
+        body_text = self.mail_template.render(name)
+        self.post(Msg.STEP, f"Sending email... ({len(self.saved_paths)} attachment(s))", 90, None)
         try:
-            send_email_gmail(conf, email, self.saved_paths, body_text)  # type: ignore[arg-type]
+            send_email_gmail(conf, email, self.saved_paths, body_text, self.smtp_session)  # type: ignore[arg-type]
         except smtplib.SMTPAuthenticationError:
-            self.post("ERROR|AUTH: Brevo rejected login. Check your username/password in mailer.conf.json.")
+            self.post(Msg.ERROR, "AUTH: Brevo rejected login. Check your username/password in mailer.conf.json.")
             return
         except ssl.SSLError as e:
-            self.post(f"ERROR|SSL: {e}. Tip: install certifi.")
+            self.post(Msg.ERROR, f"SSL: {e}. Tip: install certifi.")
             return
         except Exception as e:
-            self.post(f"ERROR|Send failed: {e}")
+            self.post(Msg.ERROR, f"Send failed: {e}")
             return
 
         # Update profile and log
@@ -861,47 +1597,124 @@ class Worker(threading.Thread):
                 "last_sent_files": [p.name for p in self.saved_paths],
                 "last_sent_time": datetime.now().isoformat(timespec="seconds"),
                 }
-        try:
-            (DEVICES_DIR / dev_id_for_fs / "profile.json").write_text(json.dumps(prof, indent=2), encoding="utf-8")
-        except Exception:
-            pass
-
         elapsed = int(time.time() - self.start_ts)
-        for src, dest in zip(selected, self.saved_paths):
-            log_line(
-                    f"SENT  label={(label or '')}  name={name}  email={email}  file={dest}  "
-                    f"src={src.name}  device_id={(device_id or '')}  model={model}  duration={elapsed}s  mode=EMAIL"
-                    )
+        saved = list(self.saved_paths)
 
-        self.post("DONE|Email sent.|100|" + str(save_dir) + "|MODE:EMAIL")
+        self._wait_eject(eject_future)  # next watch shouldn't be attached while this one is still unmounting
+        self.post(Msg.DONE, "Email sent.", 100, save_dir, "EMAIL")
+        _RECORD_POOL.submit(_record_run, dev_id_for_fs, prof, lambda: [
+                f"SENT  label={(label or '')}  name={name}  email={email}  file={dest}  "
+                f"src={src.name}  device_id={(device_id or '')}  model={model}  duration={elapsed}s  mode=EMAIL"
+                for src, dest in zip(selected, saved)
+                ])
 
-    def _receive_pick_selection(self) -> Optional[List[str]]:
-        try:
-            selected_paths = self.pick_reply_queue.get(timeout=180)
-        except queue.Empty:
-            return None
-        if selected_paths is None:
-            return None
-        if isinstance(selected_paths, (str, Path)):
-            return [str(selected_paths)]
-        elif isinstance(selected_paths, (list, tuple, set)):
-            return [str(p) for p in selected_paths]
-        else:
+    @staticmethod
+    def _wait_eject(eject_future: "Optional[concurrent.futures.Future[bool]]") -> Optional[bool]:
+        if eject_future is None:
             return None
+        try:
+            return eject_future.result(timeout=EJECT_TIMEOUT + 5)
+        except Exception:
+            return False
+
+    def _receive_pick_selection(self) -> Optional[List[Path]]:
+        deadline = time.time() + PICK_TIMEOUT
+        # Short waits so Cancel doesn't have to sit out the full picker timeout
+        while not self._pick_event.wait(0.5):
+            if self.cancel_event.is_set() or time.time() >= deadline:
+                return None
+        return self._pick_result
 
 # ---------------------------------------------------------------------------
 # Platform-specific eject helpers
 # ---------------------------------------------------------------------------
+EJECT_TIMEOUT = 10                           # seconds to wait for DiskArbitration to answer
+
+def _mac_da_unmount(volume: Path, timeout: float = EJECT_TIMEOUT) -> bool:
+    """Unmount through DiskArbitration directly (what diskutil does, minus the fork/exec)."""
+    import ctypes
+
+    cf = ctypes.CDLL("/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation")
+    da = ctypes.CDLL("/System/Library/Frameworks/DiskArbitration.framework/DiskArbitration")
+    vp = ctypes.c_void_p
+    cf.CFURLCreateFromFileSystemRepresentation.argtypes = [vp, ctypes.c_char_p, ctypes.c_long, ctypes.c_bool]
+    cf.CFURLCreateFromFileSystemRepresentation.restype = vp
+    cf.CFRunLoopGetCurrent.restype = vp
+    cf.CFRunLoopRunInMode.argtypes = [vp, ctypes.c_double, ctypes.c_bool]
+    cf.CFRunLoopRunInMode.restype = ctypes.c_int32
+    cf.CFRunLoopStop.argtypes = [vp]
+    cf.CFRelease.argtypes = [vp]
+    da.DASessionCreate.argtypes = [vp]
+    da.DASessionCreate.restype = vp
+    da.DASessionScheduleWithRunLoop.argtypes = [vp, vp, vp]
+    da.DASessionUnscheduleFromRunLoop.argtypes = [vp, vp, vp]
+    da.DADiskCreateFromVolumePath.argtypes = [vp, vp, vp]
+    da.DADiskCreateFromVolumePath.restype = vp
+    UNMOUNT_CALLBACK = ctypes.CFUNCTYPE(None, vp, vp, vp)
+    da.DADiskUnmount.argtypes = [vp, ctypes.c_uint32, UNMOUNT_CALLBACK, vp]
+    mode = vp.in_dll(cf, "kCFRunLoopDefaultMode")
+    kDADiskUnmountOptionDefault = 0
+
+    result = {"done": False, "ok": False}
+    run_loop = cf.CFRunLoopGetCurrent()
+
+    def on_unmount(_disk, dissenter, _ctx):
+        result["done"] = True
+        result["ok"] = not dissenter  # a dissenter means someone refused the unmount
+        cf.CFRunLoopStop(run_loop)
+
+    callback = UNMOUNT_CALLBACK(on_unmount)  # keep alive until the run loop returns
+    path = os.fsencode(str(volume))
+    session = da.DASessionCreate(None)
+    if not session:
+        raise OSError("DASessionCreate failed")
+    url = disk = None
+    try:
+        url = cf.CFURLCreateFromFileSystemRepresentation(None, path, len(path), True)
+        disk = da.DADiskCreateFromVolumePath(None, session, url) if url else None
+        if not disk:
+            raise OSError(f"No DiskArbitration disk for {volume}")
+        da.DASessionScheduleWithRunLoop(session, run_loop, mode)
+        try:
+            da.DADiskUnmount(disk, kDADiskUnmountOptionDefault, callback, None)
+            deadline = time.time() + timeout
+            while not result["done"] and time.time() < deadline:
+                cf.CFRunLoopRunInMode(mode, deadline - time.time(), False)
+        finally:
+            da.DASessionUnscheduleFromRunLoop(session, run_loop, mode)
+    finally:
+        for ref in (disk, url, session):
+            if ref:
+                cf.CFRelease(ref)
+    return result["ok"]
+
 def mac_eject(volume: Path) -> bool:
+    try:
+        return _mac_da_unmount(volume)
+    except Exception:
+        pass  # framework not loadable: fall back to diskutil
+    import subprocess
     try:
         res = subprocess.run(
-                ["diskutil", "unmount", str(volume)],
-                check=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+                ["/usr/sbin/diskutil", "unmount", str(volume)],
+                check=False, close_fds=False, stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
                 )
         return res.returncode == 0
     except Exception:
         return False
 
+def _run_detached(argv: List[str]) -> None:
+    """
+    Run a helper command (osascript, open) on _IO_POOL with its output discarded, so the caller never waits.
+    close_fds=False is safe (Python opens fds non-inheritable); together with an absolute program
+    path it lets subprocess use posix_spawn instead of fork + a close() per open descriptor
+    (a bare name like "open" still goes through fork_exec).
+    """
+    import subprocess
+    _IO_POOL.submit(subprocess.run, argv, check=False, close_fds=False, stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
 def win_eject_drive(root: Path) -> bool:
     # Placeholder on Windows; return True for flow purposes
     return True
@@ -909,6 +1722,95 @@ def win_eject_drive(root: Path) -> bool:
 # ---------------------------------------------------------------------------
 # Main Tk app
 # ---------------------------------------------------------------------------
+class UiQueue(queue.Queue):
+    """
+    Worker -> UI queue that wakes the Tk thread with a <<WorkerMsg>> virtual event,
+    so messages are handled right away instead of on a 100 ms poll.
+    event_generate from a non-Tk thread is marshalled through Tcl's event queue.
+    At most one wake-up is outstanding: puts that land before the UI has started
+    draining ride along on the pending event instead of each making a Tcl call.
+    """
+    def __init__(self, widget: tk.Misc):
+        super().__init__()
+        self._widget = widget
+        self._wake_lock = threading.Lock()
+        self._wake_pending = False
+        self._closed = False
+
+    def close(self) -> None:
+        """The window is going away: later puts are dropped instead of waiting on a Tk that no longer runs."""
+        self._closed = True
+
+    def put(self, item, block: bool = True, timeout: Optional[float] = None) -> None:
+        if self._closed:
+            return
+        super().put(item, block, timeout)
+        with self._wake_lock:
+            if self._wake_pending:
+                return
+            self._wake_pending = True
+        try:
+            self._widget.event_generate("<<WorkerMsg>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            self.clear_wake()  # window closing / mainloop not running: the master tick picks it up
+
+    def clear_wake(self) -> None:
+        """Called by the UI before it drains; later puts send a fresh wake-up."""
+        with self._wake_lock:
+            self._wake_pending = False
+
+class LabelVar(tk.StringVar):
+    """
+    StringVar for display-only labels: set() is skipped when the text is unchanged, so
+    no Tcl trace or label re-layout fires, and get() answers from the Python-side copy.
+    Only valid while nothing but set() writes the variable (no Entry bound to it).
+    """
+    def __init__(self, master: Optional[tk.Misc] = None, value: str = ""):
+        super().__init__(master, value)
+        self._text = value
+
+    def set(self, value: str) -> None:
+        if value != self._text:
+            self._text = value
+            super().set(value)
+
+    def get(self) -> str:
+        return self._text
+
+# Help text only interpolates module constants: built on first open, then reused
+_HELP_TEXT: Optional[str] = None
+
+def _help_text() -> str:
+    global _HELP_TEXT
+    if _HELP_TEXT is None:
+        import textwrap
+        _HELP_TEXT = textwrap.dedent(f"""
+        Garmin Mailer copies FIT activities from a connected Garmin watch and either emails them to the email address specified or archives them for later reference.
+
+        Email vs archive-only:
+          - Email (default): enter Name and Recipient email, then click Ready. The app emails the selected .FIT files and saves today's activities into {SENT_ROOT}/YYYYMMDD.
+          - Archive only: check "Archive only, do not send mail". Name/email are disabled and the app auto-starts when exactly one GARMIN volume is mounted. Files are renamed by activity date and stored under {ARCHIVE_ROOT}/YYYYMMDD with no email sent.
+
+        Storage under {BASE}:
+          - sent/YYYYMMDD/: copies of files that were emailed
+          - archive/YYYYMMDD/: archive-only copies (organized by activity date)
+          - devices/<device_id>/profile.json: remembers the label/model for each watch
+          - mail-template.txt: edit the outgoing email body
+          - watch-labels.csv: map Garmin device_ids to workshop labels (CSV with "device_id,label" per line)
+          - GarminMailer.log: timestamped record of actions and errors
+
+        Configuring emailing:
+          1. Copy example.mailer.conf.json (from the GarminMailer folder) into {CONF}.
+          2. Fill smtp_server, smtp_port, username, and password (use an app password).
+          3. Restart Garmin Mailer so it reads the settings. Archive-only mode works without this file, but emailing requires it.
+
+        Updating watch labels:
+          1. Open {LABELS_CSV}.
+          2. Each line is "device_id,label" (for example A1B2C3D4,21).
+          3. Save the file; the next time that watch connects the label populates automatically.
+        """).strip()
+    return _HELP_TEXT
+
 class App(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -947,12 +1849,30 @@ class App(tk.Tk):
         style.configure("TEntry", padding=4)
 
         # State
-        self.queue: "queue.Queue[str]" = queue.Queue()
+        self.queue = UiQueue(self)
+        self._msg_handlers = {
+                Msg.COUNT: self._handle_count,
+                Msg.STEP: self._handle_step,
+                Msg.DONE: self._handle_done,
+                Msg.ERROR: self._handle_error,
+                Msg.ASK_PICK: self._handle_ask_pick,
+                }
         self.worker: Optional[Worker] = None
         self.running = False
         self.cancel_event = threading.Event()
         self.current_submission_key: Optional[str] = None
         self._last_sent_dir: Optional[Path] = None
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        # One long-lived daemon worker thread: Submit/Retry never spawn threads, at most one
+        # run is active, and closing the window never waits for a run in progress
+        self._worker_pool = DaemonExecutor(max_workers=1, thread_name_prefix="garmin-worker")
+        self._smtp = SmtpSession()
+        atexit.register(self._smtp.close)
+        ensure_template_exists()
+        ensure_labels_csv_exists()
+        self._mail_template = MailTemplate()
+        self._volume_cache = VolumeScanCache()
+        self._last_validation: Tuple[Optional[str], Optional[str], bool] = (None, None, False)
 
         # Layout
         frm = ttk.Frame(self, padding=16)
@@ -962,6 +1882,7 @@ class App(tk.Tk):
         # Name row
         ttk.Label(frm, text="Name").grid(row=0, column=0, sticky="w")
         self.name_var = tk.StringVar()
+        self._mirror(self.name_var, "_name", str.strip)
         self.name_entry = ttk.Entry(frm, textvariable=self.name_var, width=48)
         self.name_entry.grid(row=0, column=1, sticky="ew", padx=(8, 0))
 
@@ -971,6 +1892,7 @@ class App(tk.Tk):
         email_row.grid(row=1, column=1, sticky="ew", padx=(8, 0))
         email_row.columnconfigure(0, weight=1)
         self.email_var = tk.StringVar()
+        self._mirror(self.email_var, "_email", str.strip)
         self.email_entry = ttk.Entry(email_row, textvariable=self.email_var, width=48) # type: ignore
         self.email_entry.grid(row=0, column=0, sticky="ew")
         self.submit_btn = ttk.Button(email_row, text="Ready", command=self._submit, state="disabled")
@@ -981,6 +1903,8 @@ class App(tk.Tk):
         opts_row.grid(row=2, column=0, columnspan=2, sticky="w", pady=(10, 0))
         self.unmount_var = tk.BooleanVar(value=True)      # default checked
         self.archive_only_var = tk.BooleanVar(value=False)    # default unchecked
+        self._mirror(self.unmount_var, "_unmount")
+        self._mirror(self.archive_only_var, "_archive_only")
         self.archive_only_cb = ttk.Checkbutton(opts_row, text="Archive only, do not send mail", variable=self.archive_only_var, command=self._on_archive_only_toggle)
         self.archive_only_cb.pack(side="left")
 
@@ -994,8 +1918,10 @@ class App(tk.Tk):
 
         self.pb = ttk.Progressbar(frm, orient="horizontal", mode="determinate", maximum=100)
         self.pb.grid(row=4, column=0, columnspan=2, sticky="ew")
+        self._pb_spinning = False
+        self._widget_states: Dict[tk.Widget, str] = {}
 
-        self.status_var = tk.StringVar(value="Waiting for name and email")
+        self.status_var = LabelVar(self, value="Waiting for name and email")
         ttk.Label(frm, textvariable=self.status_var).grid(row=5, column=0, columnspan=2, sticky="w", pady=(10, 0))
 
         # Open folder + Help buttons
@@ -1005,12 +1931,13 @@ class App(tk.Tk):
         self.help_btn.grid(row=6, column=1, sticky="e", pady=(8, 0))
 
         # Timer and countdown
-        self.timer_var = tk.StringVar(value="Timer: 0s")
+        self.timer_var = LabelVar(self, value="Timer: 0s")
         ttk.Label(frm, textvariable=self.timer_var, style="Small.TLabel").grid(row=7, column=0, sticky="w", pady=(8, 0))
         self.timer_seconds = 0
         self.timer_running = False
+        self._timer_origin = 0.0
 
-        self.detect_countdown_var = tk.StringVar(value="")
+        self.detect_countdown_var = LabelVar(self, value="")
         self.detect_countdown_lbl = ttk.Label(frm, textvariable=self.detect_countdown_var, style="Small.TLabel")
         self.detect_countdown_lbl.grid(row=7, column=1, sticky="e", pady=(8, 0))
         self._hide_detect_countdown()
@@ -1031,122 +1958,175 @@ class App(tk.Tk):
         ttk.Label(frm, text=version_str, style="Small.TLabel", foreground="gray").grid(row=9, column=0, sticky="w", pady=(10, 0))
 
         # Bindings
-        self.after(100, self.name_entry.focus_set)
+        self.after_idle(self.name_entry.focus_set)
         self.email_entry.bind("<Return>", lambda _e: self._submit())  # Enter in Email triggers submit (B2)
-        self.name_var.trace_add("write", self._validate_form)
-        self.email_var.trace_add("write", self._validate_form)
-        self.after(100, self._drain_queue)
-
-        # Initial UI reflect + start watcher for auto-start in archive-only mode
+        # Self-rescheduling callbacks get one Tcl command each for the App's lifetime;
+        # self.after() would create and delete a fresh one per call. Never pass these
+        # to after_cancel(), which deletes the command along with the timer.
+        self._tick_cmd = self.register(self._master_tick)
+        self._drain_cmd = self.register(self._drain_queue_once)
+        self._validate_cmd = self.register(self._run_scheduled_validate)
+        self._validation_pending = False
+        self.name_var.trace_add("write", self._schedule_validate)
+        self.email_var.trace_add("write", self._schedule_validate)
+        self.bind("<<WorkerMsg>>", lambda _e: self._drain_queue_once())
+        self.bind("<<VolumesChanged>>", lambda _e: self._watch_mount_if_archive_only())
+        self._archive_watch_stop: Optional[threading.Event] = None
+        self._pick_dialog: Optional[FileChoiceDialog] = None  # built on the first pick, then reused
+        self._tick_id: Optional[str] = None
+
+        # Initial UI reflect
         self._reflect_archive_only_state()
-        self.after(1000, self._watch_mount_if_archive_only)
+        self._ensure_ticking()
 
     # --- UI helpers ---------------------------------------------------------
+    def _mirror(self, var: tk.Variable, attr: str, convert=None) -> None:
+        """
+        Keep self.<attr> equal to var's value (passed through convert, e.g. str.strip)
+        via its write trace, so the hot paths (keystroke validation, the 1 s
+        archive-only watch) read a plain attribute instead of making a Tcl
+        round-trip per get().
+        """
+        if convert is None:
+            def update(*_):
+                setattr(self, attr, var.get())
+        else:
+            def update(*_):
+                setattr(self, attr, convert(var.get()))
+        update()
+        var.trace_add("write", update)
+
+    def _schedule_validate(self, *_):
+        """Write trace of the entries: a paste or IME burst fires many writes, validate once when idle."""
+        if not self._validation_pending:
+            self._validation_pending = True
+            self.tk.call("after", "idle", self._validate_cmd)
+
+    def _run_scheduled_validate(self) -> None:
+        self._validation_pending = False
+        self._validate_form()
+
     def _validate_form(self, *_):
-        if self.archive_only_var.get():
-            self.submit_btn.configure(state="normal" if not self.running else "disabled")
+        if self._archive_only:
+            self._set_state(self.submit_btn, "normal" if not self.running else "disabled")
             if not self.running:
                 self.status_var.set("Archive-only mode: attach a watch to begin")
             return
 
-        name_ok = bool(self.name_var.get().strip())
-        email_ok = EMAIL_RE.match(self.email_var.get().strip()) is not None
-        self.submit_btn.configure(state="normal" if (name_ok and email_ok and not self.running) else "disabled")
+        name = self._name
+        email = self._email
+        last_name, last_email, ok = self._last_validation
+        if name != last_name or email != last_email:
+            ok = bool(name) and EMAIL_RE.fullmatch(email) is not None
+            self._last_validation = (name, email, ok)
+        self._set_state(self.submit_btn, "normal" if (ok and not self.running) else "disabled")
         if not self.running:
-            self.status_var.set("Waiting for name and email" if not (name_ok and email_ok) else "Click 'Ready' when Name and Recipient email have been provided")
+            self.status_var.set("Waiting for name and email" if not ok else "Click 'Ready' when Name and Recipient email have been provided")
 
     def _on_archive_only_toggle(self):
         self._reflect_archive_only_state()
         self._validate_form()
+        self._sync_archive_watch()
 
         # NEW: If toggled ON and a GARMIN volume is already mounted → start immediately.
-        if self.archive_only_var.get() and not self.running:
+        if self._archive_only and not self.running:
             vol = find_current_garmin_volume()
             if vol is not None:
                 # Reset timer for this auto-run
                 self.current_submission_key = None
                 self._start_flow(name="", email="", reset_timer=True,
-                                 unmount_after_copy=self.unmount_var.get(),
+                                 unmount_after_copy=self._unmount,
                                  archive_only=True)
             else:
                 self.status_var.set("Archive-only mode: waiting for GARMIN volume...")
 
     def _reflect_archive_only_state(self):
-        archive_only = self.archive_only_var.get()
+        archive_only = self._archive_only
         # Enable/disable inputs
         state = "disabled" if archive_only else "normal"
-        self.name_entry.configure(state=state)
-        self.email_entry.configure(state=state)
+        self._set_state(self.name_entry, state)
+        self._set_state(self.email_entry, state)
         self.open_folder_btn.configure(text="Open 'archive' folder" if archive_only else "Open 'sent' folder")
         if archive_only:
             self.status_var.set("Archive-only mode: attach a watch to begin")
         else:
             self.status_var.set("Waiting for name and email")
 
+    def _sync_archive_watch(self) -> None:
+        """Keep a mount-change watcher thread running exactly while archive-only mode is on."""
+        if self._archive_only and self._archive_watch_stop is None:
+            stop = threading.Event()
+            self._archive_watch_stop = stop
+            threading.Thread(target=MountWatcher(stop).watch_changes, args=(self._post_volumes_changed,),
+                             name="garmin-mountwatch", daemon=True).start()
+        elif not self._archive_only and self._archive_watch_stop is not None:
+            self._archive_watch_stop.set()
+            self._archive_watch_stop = None
+
+    def _post_volumes_changed(self) -> None:
+        # Watcher thread: event_generate is marshalled through Tcl's event queue, like UiQueue's wake-up
+        try:
+            self.event_generate("<<VolumesChanged>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            pass  # window closing
+
     def _watch_mount_if_archive_only(self):
         """
-        Poll every 1s: if archive-only mode is ON, not running, and exactly one GARMIN volume is mounted → auto-start.
+        Called on <<VolumesChanged>> (re-fired for MOUNT_SETTLE seconds after each mount event) and after an archive run: if archive-only mode is ON, not running, and exactly one GARMIN volume is mounted → auto-start.
+        """
+        if self._archive_only and not self.running:
+            vol = self._volume_cache.current()
+            if vol is not None:
+                # Reset timer for this auto-run
+                self.current_submission_key = None
+                self._start_flow(name="", email="", reset_timer=True,
+                                 unmount_after_copy=self._unmount,
+                                 archive_only=True)
+            else:
+                # keep a friendly status while waiting
+                if self.status_var.get().strip() == "" or "Archive-only" not in self.status_var.get():
+                    self.status_var.set("Archive-only mode: waiting for GARMIN volume...")
+
+    def _show_help(self):
+        from tkinter import messagebox
+        messagebox.showinfo("Garmin Mailer Help", _help_text(), parent=self)
+
+    def _master_tick(self) -> None:
+        """
+        The App's single 1 s heartbeat: elapsed timer and the queue safety drain (in case
+        a <<WorkerMsg>> wake-up was lost) share one after() chain. It only keeps going
+        while a run or the timer is active, so an idle window gets no timer wake-ups at
+        all; _ensure_ticking restarts it. (The archive-only watch is event-driven.)
         """
+        self._tick_id = None
         try:
-            if self.archive_only_var.get() and not self.running:
-                vol = find_current_garmin_volume()
-                if vol is not None:
-                    # Reset timer for this auto-run
-                    self.current_submission_key = None
-                    self._start_flow(name="", email="", reset_timer=True,
-                                     unmount_after_copy=self.unmount_var.get(),
-                                     archive_only=True)
-                else:
-                    # keep a friendly status while waiting
-                    if self.status_var.get().strip() == "" or "Archive-only" not in self.status_var.get():
-                        self.status_var.set("Archive-only mode: waiting for GARMIN volume...")
+            self._drain_queue_once()
+            self._refresh_timer()
         finally:
-            self.after(1000, self._watch_mount_if_archive_only)
+            if self.running or self.timer_running:
+                self._ensure_ticking()
 
-    def _show_help(self):
-        help_text = textwrap.dedent(f"""
-            Garmin Mailer copies FIT activities from a connected Garmin watch and either emails them to the email address specified or archives them for later reference.
-
-            Email vs archive-only:
-              - Email (default): enter Name and Recipient email, then click Ready. The app emails the selected .FIT files and saves today's activities into {SENT_ROOT}/YYYYMMDD.
-              - Archive only: check "Archive only, do not send mail". Name/email are disabled and the app auto-starts when exactly one GARMIN volume is mounted. Files are renamed by activity date and stored under {ARCHIVE_ROOT}/YYYYMMDD with no email sent.
-
-            Storage under {BASE}:
-              - sent/YYYYMMDD/: copies of files that were emailed
-              - archive/YYYYMMDD/: archive-only copies (organized by activity date)
-              - devices/<device_id>/profile.json: remembers the label/model for each watch
-              - mail-template.txt: edit the outgoing email body
-              - watch-labels.csv: map Garmin device_ids to workshop labels (CSV with "device_id,label" per line)
-              - GarminMailer.log: timestamped record of actions and errors
-
-            Configuring emailing:
-              1. Copy example.mailer.conf.json (from the GarminMailer folder) into {CONF}.
-              2. Fill smtp_server, smtp_port, username, and password (use an app password).
-              3. Restart Garmin Mailer so it reads the settings. Archive-only mode works without this file, but emailing requires it.
-
-            Updating watch labels:
-              1. Open {LABELS_CSV}.
-              2. Each line is "device_id,label" (for example A1B2C3D4,21).
-              3. Save the file; the next time that watch connects the label populates automatically.
-            """).strip()
-        messagebox.showinfo("Garmin Mailer Help", help_text, parent=self)
-
-    # Timer helpers
+    def _ensure_ticking(self) -> None:
+        if self._tick_id is None:
+            self._tick_id = self.tk.call("after", 1000, self._tick_cmd)
+
+    # Timer helpers (elapsed time is measured, so the tick's phase doesn't matter)
     def _start_timer(self, reset: bool) -> None:
         if reset:
             self.timer_seconds = 0
-        if not self.timer_running:
-            self.timer_running = True
-            self._tick_timer()
+        self._timer_origin = time.monotonic() - self.timer_seconds
+        self.timer_running = True
+        self._refresh_timer()
+        self._ensure_ticking()
 
-    def _tick_timer(self) -> None:
+    def _refresh_timer(self) -> None:
         if not self.timer_running:
             return
+        self.timer_seconds = int(time.monotonic() - self._timer_origin)
         self.timer_var.set(f"Timer: {self.timer_seconds}s")
-        self.timer_seconds += 1
-        self.after(1000, self._tick_timer)
 
     def _stop_timer(self) -> None:
+        self._refresh_timer()
         self.timer_running = False
 
     # Countdown helpers
@@ -1161,18 +2141,19 @@ class App(tk.Tk):
 
     # Submit flow
     def _submit(self):
+        from tkinter import messagebox
         if self.running:
             return
 
-        archive_only = self.archive_only_var.get()
-        name = self.name_var.get().strip()
-        email = self.email_var.get().strip()
+        archive_only = self._archive_only
+        name = self._name
+        email = self._email
 
         if not archive_only:
             if not name:
                 messagebox.showinfo("Garmin Mailer", "Please enter a name.")
                 return
-            if not EMAIL_RE.match(email):
+            if not EMAIL_RE.fullmatch(email):
                 messagebox.showinfo("Garmin Mailer", "Please enter a valid email address.")
                 return
 
@@ -1181,9 +2162,18 @@ class App(tk.Tk):
         reset_timer = (self.current_submission_key is None) or (submission_key != self.current_submission_key)
         self.current_submission_key = submission_key
 
-        self._start_flow(name, email, reset_timer, self.unmount_var.get(), archive_only)
+        self._start_flow(name, email, reset_timer, self._unmount, archive_only)
+
+    def _set_state(self, widget: tk.Widget, state: str) -> None:
+        """configure(state=...) is a Tcl round-trip; skip it when the widget is already in that state."""
+        if self._widget_states.get(widget) != state:
+            widget.configure(state=state)  # type: ignore[call-arg]
+            self._widget_states[widget] = state
 
     def _set_pb_indeterminate(self, on: bool) -> None:
+        if on == self._pb_spinning:
+            return  # already in that mode: don't reconfigure or restart the animation
+        self._pb_spinning = on
         try:
             if on:
                 self.pb.config(mode="indeterminate")
@@ -1196,11 +2186,13 @@ class App(tk.Tk):
 
     def _start_flow(self, name: str, email: str, reset_timer: bool, unmount_after_copy: bool, archive_only: bool) -> None:
         self.running = True
-        self.retry_btn.configure(state="disabled")
-        self.cancel_btn.configure(state="normal")
-        self.submit_btn.configure(state="disabled")
+        self._ensure_ticking()
+        self._volume_cache.invalidate()
+        self._set_state(self.retry_btn, "disabled")
+        self._set_state(self.cancel_btn, "normal")
+        self._set_state(self.submit_btn, "disabled")
         self.cancel_event.clear()
-        self.open_folder_btn.configure(state="disabled")
+        self._set_state(self.open_folder_btn, "disabled")
         self._set_status("Detecting Garmin watch...", None)
         self._show_detect_countdown(DETECT_TIMEOUT)
         self._set_pb_indeterminate(True)
@@ -1208,9 +2200,14 @@ class App(tk.Tk):
         self.worker = Worker(
                 self.queue, name, email, self, self.cancel_event,
                 unmount_after_copy=unmount_after_copy,
-                archive_only=archive_only
+                archive_only=archive_only,
+                smtp_session=self._smtp,
+                mail_template=self._mail_template
                 )
-        self.worker.start()
+        self._start_worker()
+
+    def _start_worker(self) -> None:
+        self._worker_pool.submit(self.worker.run)
 
     def _cancel(self) -> None:
         if not self.running:
@@ -1220,6 +2217,7 @@ class App(tk.Tk):
         self._set_pb_indeterminate(True)
 
     def _retry(self) -> None:
+        from tkinter import messagebox
         if self.running:
             return
         if not self.timer_running:
@@ -1227,123 +2225,122 @@ class App(tk.Tk):
         self.pb["value"] = 0
         self.status_var.set("Detecting Garmin watch...")
         self._show_detect_countdown(DETECT_TIMEOUT)
-        name = self.name_var.get().strip()
-        email = self.email_var.get().strip()
-        archive_only = self.archive_only_var.get()
-        if archive_only or (name and EMAIL_RE.match(email)):
+        name = self._name
+        email = self._email
+        archive_only = self._archive_only
+        if archive_only or (name and EMAIL_RE.fullmatch(email)):
             self._set_pb_indeterminate(True)
             self.running = True
-            self.retry_btn.configure(state="disabled")
-            self.cancel_btn.configure(state="normal")
+            self._set_state(self.retry_btn, "disabled")
+            self._set_state(self.cancel_btn, "normal")
             self.cancel_event.clear()
             self.worker = Worker(
                     self.queue, name, email, self, self.cancel_event,
-                    unmount_after_copy=self.unmount_var.get(),
-                    archive_only=archive_only
+                    unmount_after_copy=self._unmount,
+                    archive_only=archive_only,
+                    smtp_session=self._smtp,
+                    mail_template=self._mail_template
                     )
-            self.worker.start()
+            self._start_worker()
         else:
             messagebox.showinfo("Garmin Mailer", "Enter a valid name and email first (or enable Archive-only).")
 
-    def _drain_queue(self) -> None:
-        try:
-            while True:
-                msg = self.queue.get_nowait()
-                parts = msg.split("|", 1)
-                kind = parts[0]
-
-                if kind == "COUNT":
-                    val = parts[1]
-                    if val == "HIDE":
-                        self._hide_detect_countdown()
-                    else:
-                        try:
-                            secs = int(val)
-                            self._show_detect_countdown(secs)
-                        except Exception:
-                            pass
-
-                elif kind == "STEP":
-                    # STEP|text|progress_or_spin
-                    sub = parts[1].split("|")
-                    text, prog = sub[0], sub[1] if len(sub) > 1 else None
-                    if prog == "SPIN_ON":
-                        self._set_status(text, None)
-                        self._set_pb_indeterminate(True)
-                    elif prog == "SPIN_OFF":
-                        self._set_pb_indeterminate(False)
-                        self._set_status(text, None)
-                    else:
-                        try:
-                            val = int(prog) if prog is not None else None
-                        except Exception:
-                            val = None
-                        self._set_pb_indeterminate(False)
-                        self._set_status(text, val)
-
-                elif kind == "DONE":
-                    # DONE|message|progress|/path/to/sent_dir|MODE:XXXX
-                    sub = parts[1].split("|")
-                    text = sub[0]
-                    prog = int(sub[1]) if len(sub) > 1 else 100
-                    self._last_sent_dir = Path(sub[2]) if len(sub) > 2 else None
-                    mode_tag = sub[3] if len(sub) > 3 else "MODE:EMAIL"
-                    mode = "EMAIL" if mode_tag.endswith("EMAIL") else "ARCHIVE_ONLY"
-                    self._set_pb_indeterminate(False)
-                    self._hide_detect_countdown()
-                    self._set_status(text, prog)
-                    self._on_success(mode, message=text)
-
-                elif kind == "ERROR":
-                    text = parts[1]
-                    self._set_pb_indeterminate(False)
-                    self._hide_detect_countdown()
-                    self._set_status(text, None)  # may include emoji
-                    self._on_error(text)
-
-                elif kind == "ASK_PICK":
-                    # ASK_PICK|[ "path1", "path2", ... ]
-                    sub_parts = parts[1].split("|PRESELECT:")
-                    raw_paths = sub_parts[0]
-                    preselect_single = False
-                    if len(sub_parts) > 1:
-                        preselect_single = sub_parts[1].lower() == 'true'
+    def _drain_queue_once(self) -> None:
+        # Bounded, so a burst of messages can't hold up user input; the rest goes in the next idle slot
+        self.queue.clear_wake()
+        pending: List[tuple] = []
+        for _ in range(UI_DRAIN_BATCH):
+            try:
+                pending.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        else:
+            if not self.queue.empty():
+                self.tk.call("after", "idle", self._drain_cmd)
+        # One backwards pass marks what Tk would never get to draw: every COUNT but the
+        # newest, and any STEP overwritten by a later STEP with only COUNTs in between
+        # (DONE/ERROR/ASK_PICK keep the STEP before them, which sets up their status).
+        superseded = [False] * len(pending)
+        seen_count = step_follows = False
+        for i in range(len(pending) - 1, -1, -1):
+            kind = pending[i][0]
+            if kind is Msg.COUNT:
+                superseded[i] = seen_count
+                seen_count = True
+            elif kind is Msg.STEP:
+                superseded[i] = step_follows
+                step_follows = True
+            else:
+                step_follows = False
 
-                    try:
-                        paths = [Path(s) for s in json.loads(raw_paths)]
-                    except Exception:
-                        paths = []
-
-                    # Pass copy_only status to the dialog
-                    archive_only_mode = False
-                    if self.worker:
-                        archive_only_mode = self.worker.archive_only
-
-                    chosen = FileChoiceDialog.choose(self, paths, archive_only_mode, preselect_single) if paths else None
-
-                    if self.worker and hasattr(self.worker, "pick_reply_queue"):
-                        if chosen:
-                            self.worker.pick_reply_queue.put([str(p) for p in chosen])
-                            self._set_status(f"Selected {len(chosen)} file(s).", None)
-                        else:
-                            self.worker.pick_reply_queue.put(None)
-        except queue.Empty:
-            pass
-        finally:
-            self.after(100, self._drain_queue)
+        handlers = self._msg_handlers
+        for msg, skip in zip(pending, superseded):
+            if not skip:
+                handlers[msg[0]](*msg[1:])
+
+    def _handle_count(self, secs: Optional[int]) -> None:
+        if secs is None:
+            self._hide_detect_countdown()
+        else:
+            self._show_detect_countdown(secs)
+
+    def _handle_step(self, text: str, prog: Optional[int], spin: Optional[bool]) -> None:
+        if spin is True:
+            self._set_status(text, None)
+            self._set_pb_indeterminate(True)
+        elif spin is False:
+            self._set_pb_indeterminate(False)
+            self._set_status(text, None)
+        else:
+            self._set_pb_indeterminate(False)
+            self._set_status(text, prog)
+
+    def _handle_done(self, text: str, prog: int, save_dir: Path, mode: str) -> None:
+        self._last_sent_dir = save_dir
+        self._set_pb_indeterminate(False)
+        self._hide_detect_countdown()
+        self._set_status(text, prog)
+        self._on_success(mode, message=text)
+
+    def _handle_error(self, text: str) -> None:
+        self._set_pb_indeterminate(False)
+        self._hide_detect_countdown()
+        self._set_status(text, None)  # may include emoji
+        self._on_error(text)
+
+    def _handle_ask_pick(self, entries: List[FitEntry], preselect_single: bool) -> None:
+        # Pass copy_only status to the dialog
+        archive_only_mode = False
+        if self.worker:
+            archive_only_mode = self.worker.archive_only
+
+        chosen = None
+        if entries:
+            if self._pick_dialog is None:
+                self._pick_dialog = FileChoiceDialog(self)
+            self._pick_dialog.reset(entries, archive_only_mode, preselect_single)
+            chosen = self._pick_dialog.show_modal()
+
+        if self.worker:
+            if chosen:
+                self.worker.deliver_pick(chosen)
+                self._set_status(f"Selected {len(chosen)} file(s).", None)
+            else:
+                self.worker.deliver_pick(None)
 
     def _set_status(self, text: str, prog: Optional[int]) -> None:
         self.status_var.set(text)
         if prog is not None:
             self.pb["value"] = max(0, min(100, prog))
-        self.update_idletasks()
+        # No update_idletasks(): every caller runs inside the event loop, which redraws once it is idle
 
     def _on_success(self, mode: str, message: str) -> None:
+        from tkinter import messagebox
         self._stop_timer()
         self.running = False
-        self.cancel_btn.configure(state="disabled")
-        self.open_folder_btn.configure(state="normal")
-        self.submit_btn.configure(state="normal")
+        self._set_state(self.cancel_btn, "disabled")
+        self._set_state(self.open_folder_btn, "normal")
+        self._set_state(self.submit_btn, "normal")
         try:
             self.bell()
         except Exception:
@@ -1351,50 +2348,56 @@ class App(tk.Tk):
 
         if mode == "EMAIL":
             if IS_MAC:
-                # Show a native macOS notification
-                try:
-                    subprocess.run(
-                            ["osascript", "-e", 'display notification "Email sent." with title "Garmin Mailer"'],
-                            check=False
-                            )
-                except Exception:
-                    pass
+                # Show a native macOS notification (osascript can take a few hundred ms: keep it off the Tk thread)
+                _run_detached(["/usr/bin/osascript", "-e", 'display notification "Email sent." with title "Garmin Mailer"'])
 
             # Show a popup message
-            email = self.email_var.get()
+            email = self._email
             attachment_count = len(self.worker.saved_paths) if self.worker is not None and hasattr(self.worker, "saved_paths") else 0
             message = f"Email successfully sent to {email} with {attachment_count} attachment{'s' if attachment_count != 1 else ''}."
             messagebox.showinfo("Garmin Mailer", message)
         else:
             self.status_var.set(message)
             self.pb["value"] = 100
-            self.open_folder_btn.configure(state="normal")
+            self._set_state(self.open_folder_btn, "normal")
             messagebox.showinfo("Garmin Mailer", message)
             # Ready for next cycle (fields remain disabled in copy-only)
             self._validate_form()
-            self.submit_btn.configure(state="normal")
+            self._set_state(self.submit_btn, "normal")
+            # A watch plugged in during the run raised its <<VolumesChanged>> while we were busy
+            self._watch_mount_if_archive_only()
 
     def _on_error(self, text: str) -> None:
+        from tkinter import messagebox
         self._stop_timer()
         self.running = False
-        self.cancel_btn.configure(state="disabled")
+        self._set_state(self.cancel_btn, "disabled")
         try:
             self.bell()  # audible ding on error/timeouts
         except Exception:
             pass
         messagebox.showerror("Garmin Mailer Error", text)
-        self.retry_btn.configure(state="normal")
+        self._set_state(self.retry_btn, "normal")
         self._validate_form()
 
+    def _on_close(self) -> None:
+        # Let a running Worker bail out (detection and picker waits watch cancel_event)
+        self.cancel_event.set()
+        if self._archive_watch_stop is not None:
+            self._archive_watch_stop.set()
+        self.queue.close()
+        self.destroy()
+
     def _open_folder(self) -> None:
-        archive_only = self.archive_only_var.get()
+        from tkinter import messagebox
+        archive_only = self._archive_only
         if archive_only:
             target = self._last_sent_dir or ARCHIVE_ROOT
         else:
             target = self._last_sent_dir or SENT_ROOT
         try:
             if IS_MAC:
-                subprocess.run(["open", str(target)], check=False)
+                _run_detached(["/usr/bin/open", str(target)])
             else:
                 os.startfile(str(target))  # type: ignore[attr-defined]
         except Exception: